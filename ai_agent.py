@@ -23,12 +23,19 @@ class EnhancedAIAgent:
     """Enhanced AI agent with smart form handling and context awareness"""
     
     def __init__(self, cv_data: CVData, ollama_url: str = "http://localhost:11434", 
-                 model: str = "qwen2.5:7b"):
+                 model: str = "qwen2.5:7b", cache=None, session: Optional[requests.Session] = None):
         self.cv_data = cv_data
         self.ollama_url = ollama_url
         self.model = model
+        self.cache = cache  # Optional AIResponseCache shared with the CV analyzer
         self.logger = logging.getLogger(__name__)
         
+        # Reuse one keep-alive connection to Ollama across questions (shared with the CV analyzer when given)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'Connection': 'keep-alive'})
+        self.session = session
+        
         # Context for different types of questions
         self.question_patterns = {
             'experience': [
@@ -411,7 +418,13 @@ Examples:
 - Text: brief professional response
 """
             
-            response = requests.post(
+            # The prompt holds the CV profile, job and question, so it fully determines the answer
+            cache_key = self.cache.make_key(self.model, prompt) if self.cache else None
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached is not None:
+                return cached
+            
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -424,7 +437,10 @@ Examples:
             
             if response.status_code == 200:
                 result = response.json()['response'].strip()
-                return result.replace('"', '').replace("'", "").strip()
+                result = result.replace('"', '').replace("'", "").strip()
+                if self.cache:
+                    self.cache.set(cache_key, result)
+                return result
             
         except Exception as e:
             self.logger.error(f"AI response error: {e}")
@@ -514,7 +530,12 @@ Requirements:
 Format as a proper cover letter without placeholders.
 """
             
-            response = requests.post(
+            cache_key = self.cache.make_key(self.model, prompt) if self.cache else None
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached is not None:
+                return cached
+            
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -526,7 +547,10 @@ Format as a proper cover letter without placeholders.
             )
             
             if response.status_code == 200:
-                return response.json()['response'].strip()
+                letter = response.json()['response'].strip()
+                if self.cache:
+                    self.cache.set(cache_key, letter)
+                return letter
             
         except Exception as e:
             self.logger.error(f"Cover letter generation error: {e}")
@@ -4,8 +4,10 @@ All settings in one place for better maintainability
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Union
+import re
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import List, Dict, FrozenSet, Optional, Set, Union
 from enum import Enum
 
 class ExperienceLevel(Enum):
@@ -97,6 +99,7 @@ class ApplicationPreferences:
     follow_companies: bool = False
     max_applications_per_day: int = 50
     delay_between_applications: tuple = (30, 60)  # seconds
+    prefetch_next: bool = True  # Load the next job page at the start of the delay
     auto_skip_complex_forms: bool = False
     save_application_data: bool = True
     
@@ -118,33 +121,57 @@ class ApplicationPreferences:
         "management_experience": "2 years"
     })
 
+def keyword_set(*keywords: str) -> FrozenSet[str]:
+    """Casefolded keyword set for the filters; matching casefolds the job text once instead of every keyword"""
+    return frozenset(keyword.casefold() for keyword in keywords)
+
+def keyword_pattern(keywords: FrozenSet[str], whole_words: bool = False) -> Optional["re.Pattern"]:
+    """One alternation regex over all keywords, so a text is scanned once however many keywords there are"""
+    if not keywords:
+        return None
+    # Longest first so a longer keyword wins over its own prefix
+    alternation = "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    if whole_words:
+        # Lookarounds instead of \b so keywords starting/ending in symbols (".net", "c#") still match
+        alternation = rf"(?<!\w)(?:{alternation})(?!\w)"
+    return re.compile(alternation)
+
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+def company_slug(name: str) -> str:
+    """Casefolded company name with punctuation and spaces removed, so "J.P. Morgan" and "JP Morgan" compare equal"""
+    return _NON_ALNUM_RE.sub("", name.casefold())
+
 @dataclass
 class FilteringCriteria:
-    """Advanced filtering options"""
-    # Companies to avoid
-    blacklisted_companies: List[str] = field(default_factory=lambda: [
+    """Advanced filtering options (keyword sets are casefolded, see keyword_set)"""
+    # Companies to avoid (whole words or the same slug, so "SAP" does not match "Sapient")
+    blacklisted_companies: FrozenSet[str] = field(default_factory=lambda: keyword_set(
         "Apple", "Google", "Microsoft", "Amazon", "Facebook", "Meta", "Netflix",
         "IBM", "Salesforce", "Oracle", "SAP", "Intel", "Cisco", "Adobe"
-    ])
+    ))
     
     # Only apply to these companies (empty = all companies)
-    whitelisted_companies: List[str] = field(default_factory=list)
+    whitelisted_companies: FrozenSet[str] = field(default_factory=frozenset)
     
-    # Job titles to avoid
-    blacklisted_titles: List[str] = field(default_factory=lambda: [
-        "manager", "sales", "marketing", "hr", "recruiter", "intern"
-    ])
+    # Job titles to avoid (whole words, so "hr" does not match "Chrome")
+    blacklisted_titles: FrozenSet[str] = field(default_factory=lambda: keyword_set(
+        "manager", "sales", "marketing", "hr", "recruiter", "intern", "internship"
+    ))
     
     # Only apply to jobs with these titles (empty = all titles)
-    whitelisted_titles: List[str] = field(default_factory=list)
+    whitelisted_titles: FrozenSet[str] = field(default_factory=frozenset)
+    
+    # Reject jobs by the skill lists below (off by default: a passing mention would reject a job)
+    filter_by_skills: bool = False
     
     # Skills that must be present in job description
-    required_skills: List[str] = field(default_factory=list)
+    required_skills: FrozenSet[str] = field(default_factory=frozenset)
     
     # Skills to avoid in job description
-    avoided_skills: List[str] = field(default_factory=lambda: [
+    avoided_skills: FrozenSet[str] = field(default_factory=lambda: keyword_set(
         ".NET", "C#", "Java", "PHP", "Ruby"
-    ])
+    ))
     
     # Minimum and maximum salary expectations
     min_salary: Optional[int] = 60000  # USD
@@ -154,13 +181,68 @@ class FilteringCriteria:
     preferred_company_sizes: List[str] = field(default_factory=lambda: [
         "51-200", "201-500", "501-1000"  # Avoid very small or very large companies
     ])
+    
+    def __post_init__(self):
+        self.refresh_matchers()
+    
+    def refresh_matchers(self):
+        """Compile the keyword sets into matchers; call again after replacing any of them"""
+        # User configs may assign plain mixed-case lists, so normalize every set before compiling
+        self.blacklisted_companies = keyword_set(*self.blacklisted_companies)
+        self.whitelisted_companies = keyword_set(*self.whitelisted_companies)
+        self.blacklisted_titles = keyword_set(*self.blacklisted_titles)
+        self.whitelisted_titles = keyword_set(*self.whitelisted_titles)
+        self.required_skills = keyword_set(*self.required_skills)
+        self.avoided_skills = keyword_set(*self.avoided_skills)
+        
+        self._blacklisted_company_slugs = frozenset(map(company_slug, self.blacklisted_companies))
+        self._whitelisted_company_slugs = frozenset(map(company_slug, self.whitelisted_companies))
+        self._blacklisted_companies_re = keyword_pattern(self.blacklisted_companies, whole_words=True)
+        self._whitelisted_companies_re = keyword_pattern(self.whitelisted_companies, whole_words=True)
+        self._blacklisted_titles_re = keyword_pattern(self.blacklisted_titles, whole_words=True)
+        self._whitelisted_titles_re = keyword_pattern(self.whitelisted_titles, whole_words=True)
+        self._avoided_skills_re = keyword_pattern(self.avoided_skills, whole_words=True)
+        self._required_skills_re = keyword_pattern(self.required_skills, whole_words=True)
+    
+    def company_blacklisted(self, company: str) -> bool:
+        """True if the casefolded company name has a blacklisted slug or contains a blacklisted name as whole words"""
+        return (company_slug(company) in self._blacklisted_company_slugs
+                or bool(self._blacklisted_companies_re and self._blacklisted_companies_re.search(company)))
+    
+    def company_whitelisted(self, company: str) -> bool:
+        """True if there is no company whitelist or the casefolded company name matches it like company_blacklisted"""
+        if not self._whitelisted_companies_re:
+            return True
+        return (company_slug(company) in self._whitelisted_company_slugs
+                or bool(self._whitelisted_companies_re.search(company)))
+    
+    def title_blacklisted(self, title: str) -> bool:
+        """True if the casefolded title contains a blacklisted word or phrase"""
+        return bool(self._blacklisted_titles_re and self._blacklisted_titles_re.search(title))
+    
+    def title_whitelisted(self, title: str) -> bool:
+        """True if there is no title whitelist or the casefolded title contains a whitelisted word or phrase"""
+        return not self._whitelisted_titles_re or bool(self._whitelisted_titles_re.search(title))
+    
+    def avoided_skill_in(self, description: str) -> Optional[str]:
+        """First avoided skill mentioned in the casefolded description, if any"""
+        match = self._avoided_skills_re and self._avoided_skills_re.search(description)
+        return match.group(0) if match else None
+    
+    def missing_required_skills(self, description: str) -> Set[str]:
+        """Required skills not mentioned in the casefolded description, from a single scan"""
+        if not self._required_skills_re:
+            return set()
+        found = set(self._required_skills_re.findall(description))
+        return {skill for skill in self.required_skills if skill.casefold() not in found}
 
 @dataclass
 class BrowserConfig:
     """Browser and automation settings"""
     browser: str = "chrome"  # chrome or firefox
     headless: bool = False
-    user_data_dir: str = ""
+    user_data_dir: str = "~/.linkedin_bot/chrome_profile"  # persistent Chrome profile keeps the login and cache ("" for a fresh one)
+    disk_cache_size: int = 200_000_000  # bytes of HTTP cache Chrome may keep in the profile
     firefox_profile_dir: str = ""
     window_size: tuple = (1920, 1080)
     enable_stealth: bool = True
@@ -170,6 +252,7 @@ class BrowserConfig:
     page_load_timeout: int = 30
     element_timeout: int = 10
     typing_delay: float = 0.1
+    paste_threshold: int = 40  # longer texts are entered in one go instead of char by char
     human_delay: tuple = (1, 3)  # min, max seconds
 
 @dataclass
@@ -181,6 +264,11 @@ class AIConfig:
     temperature: float = 0.1
     max_tokens: int = 1000
     timeout: int = 30
+    concurrent_evals: int = 4  # form questions sent to Ollama at the same time
+    
+    # Persistent cache of model answers keyed by prompt hash ("" disables it)
+    cache_path: str = "~/.linkedin_bot/ai_cache.sqlite"
+    cache_ttl: int = 7 * 86400  # seconds
     
     # AI response customization
     response_style: str = "professional"  # professional, casual, enthusiastic
@@ -198,14 +286,13 @@ class LoggingConfig:
     
     # Export settings
     export_applied_jobs: bool = True
-    export_format: str = "csv"  # csv, json, xlsx
+    export_format: str = "csv"  # csv or arrow (needs pyarrow, falls back to csv)
     include_job_descriptions: bool = True
+    export_sqlite: str = "~/.linkedin_bot/applied.db"  # every processed job, across runs ("" disables)
 
 @dataclass
 class SecurityConfig:
     """Security and privacy settings"""
-    linkedin_email: str = "amanhuriya2@gmail.com"
-    linkedin_password: str = "Testings@321"
     enable_2fa_detection: bool = True
     proxy_url: str = ""
     rotate_user_agents: bool = True
@@ -214,6 +301,15 @@ class SecurityConfig:
     # Rate limiting
     max_requests_per_minute: int = 30
     cooldown_on_detection: int = 300  # seconds
+    
+    # Credentials come from the environment on first use; assigning them still overrides
+    @cached_property
+    def linkedin_email(self) -> str:
+        return os.environ.get("LINKEDIN_EMAIL", "")
+    
+    @cached_property
+    def linkedin_password(self) -> str:
+        return os.environ.get("LINKEDIN_PASSWORD", "")
 
 class EnhancedConfig:
     """Main configuration class combining all settings"""
@@ -233,13 +329,12 @@ class EnhancedConfig:
         
         # Load from file if exists
         self._load_from_file()
+        
+        # User overrides may have replaced keyword sets
+        self.filtering.refresh_matchers()
     
     def _load_from_env(self):
-        """Load sensitive data from environment variables"""
-        if os.getenv("LINKEDIN_EMAIL"):
-            self.security.linkedin_email = os.getenv("LINKEDIN_EMAIL")
-        if os.getenv("LINKEDIN_PASSWORD"):
-            self.security.linkedin_password = os.getenv("LINKEDIN_PASSWORD")
+        """Load sensitive data from environment variables (credentials are read lazily by SecurityConfig)"""
         if os.getenv("OLLAMA_URL"):
             self.ai.ollama_url = os.getenv("OLLAMA_URL")
     
@@ -275,6 +370,15 @@ class EnhancedConfig:
         if not self.job_search.locations:
             errors.append("At least one location is required")
         
+        # A misspelt setting becomes a stray attribute that nothing reads, so report it
+        for section_name in ("personal_info", "job_search", "application_prefs", "filtering",
+                             "browser", "ai", "logging", "security"):
+            section = getattr(self, section_name)
+            known = {f.name for f in fields(section)}
+            for name in vars(section):
+                if name not in known and not name.startswith('_') and not hasattr(type(section), name):
+                    errors.append(f"Unknown setting: config.{section_name}.{name}")
+        
         return errors
     
     def to_dict(self) -> Dict:
@@ -301,8 +405,6 @@ config = EnhancedConfig()
 
 # Backward compatibility - expose old config format
 browser = [config.browser.browser]
-email = config.security.linkedin_email
-password = config.security.linkedin_password
 location = config.job_search.locations
 keywords = config.job_search.keywords
 experienceLevels = [e.value for e in config.job_search.experience_levels]
@@ -333,4 +435,12 @@ full_name = config.personal_info.full_name
 phone = config.personal_info.phone
 current_title = config.personal_info.current_title
 education = config.personal_info.education
-skills = config.personal_info.skills
\ No newline at end of file
+skills = config.personal_info.skills
+
+def __getattr__(name):
+    """Old-style credential aliases, resolved only when something asks for them"""
+    if name == "email":
+        return config.security.linkedin_email
+    if name == "password":
+        return config.security.linkedin_password
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
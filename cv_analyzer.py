@@ -6,11 +6,16 @@ Extracts comprehensive information from CV files
 import os
 import re
 import json
+import mmap
+import hashlib
 import requests
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
 import logging
 
+# Markdown code fence around a model's JSON answer; the closing fence may be missing
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.S)
+
 @dataclass
 class CVData:
     """Structured CV data"""
@@ -72,11 +77,17 @@ class CVData:
 class EnhancedCVAnalyzer:
     """Enhanced CV analyzer with multiple extraction methods"""
     
-    def __init__(self, ollama_url: str = "http://localhost:11434", model: str = "qwen2.5:7b"):
+    def __init__(self, ollama_url: str = "http://localhost:11434", model: str = "qwen2.5:7b",
+                 cache=None):
         self.ollama_url = ollama_url
         self.model = model
+        self.cache = cache  # Optional AIResponseCache
         self.logger = logging.getLogger(__name__)
         
+        # Keep-alive Ollama connection, handed on to the AI agent afterwards
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        
         # Skill categories for better organization
         self.skill_categories = {
             'programming_languages': [
@@ -110,20 +121,40 @@ class EnhancedCVAnalyzer:
             
             file_ext = cv_path.lower().split('.')[-1]
             
+            # Reuse the text extracted from a byte-identical CV instead of re-parsing it
+            cache_key = self.cache.make_key("cv-text", self.file_hash(cv_path)) if self.cache else None
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                self.logger.info("Using cached CV text")
+                return cached
+            
             if file_ext == 'pdf':
-                return self._extract_pdf_text(cv_path)
+                text = self._extract_pdf_text(cv_path)
             elif file_ext in ['docx', 'doc']:
-                return self._extract_docx_text(cv_path)
+                text = self._extract_docx_text(cv_path)
             elif file_ext == 'txt':
-                return self._extract_txt_text(cv_path)
+                text = self._extract_txt_text(cv_path)
             else:
                 self.logger.error(f"Unsupported CV format: {file_ext}")
                 return ""
+            
+            if cache_key and text.strip():
+                self.cache.set(cache_key, text)
+            return text
                 
         except Exception as e:
             self.logger.error(f"Error extracting CV text: {e}")
             return ""
     
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """BLAKE2b digest of a file's bytes, hashed straight from a read-only memory map"""
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return hashlib.blake2b(b"").hexdigest()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.blake2b(mapped).hexdigest()
+    
     def _extract_pdf_text(self, pdf_path: str) -> str:
         """Extract text from PDF"""
         try:
@@ -191,7 +222,14 @@ class EnhancedCVAnalyzer:
             
             prompt = self._create_analysis_prompt(cv_text)
             
-            response = requests.post(
+            # An unchanged CV gives the same prompt, so its analysis can be reused across runs
+            cache_key = self.cache.make_key(self.model, prompt) if self.cache else None
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached is not None:
+                self.logger.info("Using cached CV analysis")
+                return self._parse_ai_response(cached, cv_text)
+            
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -208,6 +246,8 @@ class EnhancedCVAnalyzer:
             
             if response.status_code == 200:
                 result = response.json()['response'].strip()
+                if self.cache:
+                    self.cache.set(cache_key, result)
                 return self._parse_ai_response(result, cv_text)
             else:
                 self.logger.error(f"AI API error: {response.status_code}")
@@ -300,10 +340,9 @@ Instructions:
         """Parse AI response and create CVData object"""
         try:
             # Clean up response to extract JSON
-            if '```json' in ai_response:
-                ai_response = ai_response.split('```json')[1].split('```')[0]
-            elif '```' in ai_response:
-                ai_response = ai_response.split('```')[1].split('```')[0]
+            fence = _FENCE_RE.search(ai_response)
+            if fence:
+                ai_response = fence.group(1)
             
             # Try to parse JSON
             data = json.loads(ai_response.strip())
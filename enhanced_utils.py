@@ -6,12 +6,19 @@ Provides helper functions and data management
 import os
 import json
 import csv
+import time
+import sqlite3
+import hashlib
 import logging
+import threading
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 import re
 from urllib.parse import quote_plus, unquote_plus
 
+# Numeric job ID in a job view URL, e.g. https://www.linkedin.com/jobs/view/4012345678/?trackingId=...
+_JOB_ID_RE = re.compile(r'/jobs/view/(\d+)')
+
 class DataManager:
     """Manages application data and session persistence"""
     
@@ -118,6 +125,118 @@ class DataManager:
             self.logger.error(f"❌ Error loading previous applications: {e}")
             return []
 
+class AIResponseCache:
+    """Persistent cache of model responses keyed by a hash of the prompt (CV + job text + question)"""
+    
+    def __init__(self, path: str = "~/.linkedin_bot/ai_cache.sqlite", ttl: int = 7 * 86400):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.logger = logging.getLogger(__name__)
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Answers for one form are fetched from worker threads, so the connection is shared under a lock
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT, created REAL)"
+        )
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Stable content hash of the given strings (model, prompt, ...)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None when missing or older than the TTL"""
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.ttl)
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            self.logger.warning(f"AI cache read failed: {e}")
+            return None
+    
+    def set(self, key: str, value: str):
+        """Store a response"""
+        try:
+            with self._lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"AI cache write failed: {e}")
+
+class AppliedJobsStore:
+    """Durable log of processed jobs in a WAL-mode SQLite database, used to skip jobs applied to in earlier runs"""
+    
+    def __init__(self, path: str = "~/.linkedin_bot/applied.db", batch_size: int = 10):
+        self.path = os.path.expanduser(path)
+        self.batch_size = batch_size
+        self.pending = 0
+        self.logger = logging.getLogger(__name__)
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS applied ("
+            "job_id TEXT PRIMARY KEY, company TEXT, title TEXT, status TEXT, applied_at REAL, url TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS applied_company ON applied (company)")
+        self.conn.commit()
+    
+    def record(self, job_id: str, company: str, title: str, status: str, applied_at: datetime, url: str):
+        """Record a processed job under its numeric job id; rows are committed in batches of batch_size"""
+        if not job_id:
+            return
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO applied (job_id, company, title, status, applied_at, url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, company, title, status, applied_at.timestamp(), url)
+            )
+            self.pending += 1
+            if self.pending >= self.batch_size:
+                self.flush()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Applied jobs store write failed: {e}")
+    
+    def flush(self):
+        """Commit recorded rows"""
+        try:
+            self.conn.commit()
+            self.pending = 0
+        except sqlite3.Error as e:
+            self.logger.warning(f"Applied jobs store commit failed: {e}")
+    
+    def has_applied(self, job_id: str) -> bool:
+        """Whether an application to this job was already submitted"""
+        if not job_id:
+            return False
+        try:
+            return self.conn.execute(
+                "SELECT 1 FROM applied WHERE job_id = ? AND status = 'applied'", (job_id,)
+            ).fetchone() is not None
+        except sqlite3.Error as e:
+            self.logger.warning(f"Applied jobs store read failed: {e}")
+            return False
+    
+    def close(self):
+        """Commit outstanding rows and close the database"""
+        self.flush()
+        self.conn.close()
+
 class URLGenerator:
     """Generates LinkedIn job search URLs with various filters"""
     
@@ -429,6 +548,11 @@ def urlToKeywords(url: str) -> str:
     return "Unknown"
 
 # Additional utility functions
+def job_id_from_url(url: str) -> Optional[str]:
+    """Numeric LinkedIn job ID from a /jobs/view/<id> URL, or None if the URL has none"""
+    match = _JOB_ID_RE.search(url or "")
+    return match.group(1) if match else None
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable format"""
     if seconds < 60:
@@ -18,6 +18,9 @@ import constants
 import config
 import undetected_chromedriver as uc
 
+# Markdown code fence around a model's JSON answer; the closing fence may be missing
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.S)
+
 class AIAgent:
     def __init__(self, ollama_url="http://localhost:11434", model="qwen2.5:7b", cv_path="cv.pdf"):
         self.ollama_url = ollama_url
@@ -170,10 +173,9 @@ Important:
                 result = response.json()['response'].strip()
                 
                 # Clean up the response to extract JSON
-                if '```json' in result:
-                    result = result.split('```json')[1].split('```')[0]
-                elif '```' in result:
-                    result = result.split('```')[1].split('```')[0]
+                fence = _FENCE_RE.search(result)
+                if fence:
+                    result = fence.group(1)
                 
                 # Try to parse JSON
                 try:
@@ -2931,10 +2933,9 @@ Focus on the most relevant job titles based on the skills and experience.
                 result = response.json()['response'].strip()
                 
                 # Clean up and parse JSON
-                if '```json' in result:
-                    result = result.split('```json')[1].split('```')[0]
-                elif '```' in result:
-                    result = result.split('```')[1].split('```')[0]
+                fence = _FENCE_RE.search(result)
+                if fence:
+                    result = fence.group(1)
                 
                 try:
                     job_keywords = json.loads(result)
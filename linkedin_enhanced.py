@@ -13,6 +13,8 @@ from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 
 # Selenium imports
@@ -31,9 +33,19 @@ from selenium.common.exceptions import (
 )
 
 # Local imports
-from config_enhanced import EnhancedConfig
+from config_enhanced import EnhancedConfig, ExperienceLevel, JobType, RemoteType
 from cv_analyzer import EnhancedCVAnalyzer, CVData
 from ai_agent import EnhancedAIAgent, FormResponse
+from enhanced_utils import AIResponseCache, AppliedJobsStore, job_id_from_url
+
+# Lower bounds (USD) of LinkedIn's salary filter buckets; f_SB2 code is the 1-based bucket index
+_SALARY_BUCKETS = (40000, 60000, 80000, 100000, 120000, 140000, 160000, 180000, 200000)
+_SALARY_AMOUNT_RE = re.compile(r"\$?([\d,]+)")
+
+def _filter_codes(enum_cls, selected) -> str:
+    """LinkedIn filter value for the selected members: 1-based positions in the enum's declaration order"""
+    selected = set(selected)
+    return ','.join(str(code) for code, member in enumerate(enum_cls, 1) if member in selected)
 
 @dataclass
 class JobApplication:
@@ -78,6 +90,7 @@ class EnhancedLinkedInBot:
         self.stats = ApplicationStats()
         self.applied_jobs = []
         self.session_data = {}
+        self.applied_store = None
         
         # Setup logging
         self._setup_logging()
@@ -87,6 +100,9 @@ class EnhancedLinkedInBot:
         
         # Load previous session data
         self._load_session_data()
+        
+        if self.config.logging.export_sqlite:
+            self.applied_store = AppliedJobsStore(self.config.logging.export_sqlite)
     
     def _setup_logging(self):
         """Setup comprehensive logging"""
@@ -110,10 +126,16 @@ class EnhancedLinkedInBot:
     def _initialize_components(self):
         """Initialize CV analyzer and AI agent"""
         try:
+            # Model answers cached on disk, keyed by prompt hash
+            ai_cache = None
+            if self.config.ai.cache_path:
+                ai_cache = AIResponseCache(self.config.ai.cache_path, self.config.ai.cache_ttl)
+            
             # Initialize CV analyzer
             self.cv_analyzer = EnhancedCVAnalyzer(
                 ollama_url=self.config.ai.ollama_url,
-                model=self.config.ai.model
+                model=self.config.ai.model,
+                cache=ai_cache
             )
             
             # Extract and analyze CV
@@ -128,7 +150,9 @@ class EnhancedLinkedInBot:
             self.ai_agent = EnhancedAIAgent(
                 cv_data=self.cv_data,
                 ollama_url=self.config.ai.ollama_url,
-                model=self.config.ai.model
+                model=self.config.ai.model,
+                cache=ai_cache,
+                session=self.cv_analyzer.session
             )
             
             self.logger.info(f"✅ CV Analysis Complete! Found {len(self.cv_data.technical_skills)} technical skills")
@@ -230,9 +254,12 @@ class EnhancedLinkedInBot:
         if self.config.browser.headless:
             options.add_argument("--headless")
         
-        # User data directory
+        # User data directory: cookies and LinkedIn's cached bundles survive between runs
         if self.config.browser.user_data_dir:
-            options.add_argument(f"--user-data-dir={self.config.browser.user_data_dir}")
+            user_data_dir = os.path.expanduser(self.config.browser.user_data_dir)
+            os.makedirs(user_data_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            options.add_argument(f"--disk-cache-size={self.config.browser.disk_cache_size}")
         
         # Additional preferences
         prefs = {
@@ -350,8 +377,15 @@ class EnhancedLinkedInBot:
                 element.clear()
                 self.human_like_delay(0.2, 0.4)
             
-            # Type with human-like delays
-            for char in str(text):
+            text = str(text)
+            if len(text) > self.config.browser.paste_threshold:
+                # Long answers go in one WebDriver command followed by a single pause
+                element.send_keys(text)
+                self.human_like_delay(0.5, 1.2)
+                return True
+            
+            # Type short answers with human-like delays
+            for char in text:
                 element.send_keys(char)
                 time.sleep(random.uniform(0.05, self.config.browser.typing_delay))
             
@@ -391,6 +425,11 @@ class EnhancedLinkedInBot:
             self.driver.get("https://www.linkedin.com/login")
             self.human_like_delay(2, 4)
             
+            # A persistent profile that is still signed in gets redirected straight to the feed
+            if "linkedin.com/feed" in self.driver.current_url:
+                self.logger.info("✅ Already logged in from saved browser profile")
+                return True
+            
             # Find and fill username
             username_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
             self.safe_type(username_field, self.config.security.linkedin_email)
@@ -432,37 +471,36 @@ class EnhancedLinkedInBot:
         urls = []
         base_url = "https://www.linkedin.com/jobs/search/?"
         
+        # Resolve the salary filter once: "$70,000+" falls in the $60,000+ bucket
+        salary_code = None
+        salary_match = _SALARY_AMOUNT_RE.match(self.config.job_search.salary_range or "")
+        if salary_match:
+            bucket = bisect_right(_SALARY_BUCKETS, int(salary_match.group(1).replace(',', '') or 0))
+            if bucket:
+                salary_code = str(bucket)
+        
+        # Everything but the keyword and location is the same for every URL, so encode it once
+        job_search = self.config.job_search
+        filters = {
+            'f_TPR': 'r86400' if job_search.date_posted.value == "Past 24 hours" else 'r604800',
+            'f_AL': 'true',  # Easy Apply only
+            'f_E': _filter_codes(ExperienceLevel, job_search.experience_levels),
+            'f_JT': _filter_codes(JobType, job_search.job_types),
+            'f_WT': _filter_codes(RemoteType, job_search.remote_types)
+        }
+        
+        # Add salary filter if specified
+        if salary_code:
+            filters['f_SB2'] = salary_code
+        
+        filter_params = '&'.join([f"{k}={quote_plus(str(v))}" for k, v in filters.items()])
+        locations = [quote_plus(location) for location in job_search.locations[:5]]  # Limit to top 5 locations
+        
         # Generate keyword-location combinations
-        for keyword in self.config.job_search.keywords[:10]:  # Limit to top 10 keywords
-            for location in self.config.job_search.locations[:5]:  # Limit to top 5 locations
-                params = {
-                    'keywords': keyword,
-                    'location': location,
-                    'f_TPR': 'r86400' if self.config.job_search.date_posted.value == "Past 24 hours" else 'r604800',
-                    'f_AL': 'true',  # Easy Apply only
-                    'f_E': ','.join([str(i) for i, level in enumerate([
-                        "Internship", "Entry level", "Associate", "Mid-Senior level", "Director", "Executive"
-                    ]) if any(exp_level.value == level for exp_level in self.config.job_search.experience_levels)]),
-                    'f_JT': ','.join([str(i) for i, jtype in enumerate([
-                        "Full-time", "Part-time", "Contract", "Temporary", "Volunteer", "Internship", "Other"
-                    ]) if any(job_type.value == jtype for job_type in self.config.job_search.job_types)]),
-                    'f_WT': ','.join([str(i+1) for i, rtype in enumerate([
-                        "On-site", "Remote", "Hybrid"
-                    ]) if any(remote_type.value == rtype for remote_type in self.config.job_search.remote_types)])
-                }
-                
-                # Add salary filter if specified
-                if self.config.job_search.salary_range:
-                    salary_mapping = {
-                        "$40,000+": "1", "$60,000+": "2", "$80,000+": "3", "$100,000+": "4",
-                        "$120,000+": "5", "$140,000+": "6", "$160,000+": "7", "$180,000+": "8", "$200,000+": "9"
-                    }
-                    if self.config.job_search.salary_range in salary_mapping:
-                        params['f_SB2'] = salary_mapping[self.config.job_search.salary_range]
-                
-                # Build URL
-                url_params = '&'.join([f"{k}={quote_plus(str(v))}" for k, v in params.items()])
-                urls.append(f"{base_url}{url_params}")
+        for keyword in job_search.keywords[:10]:  # Limit to top 10 keywords
+            keyword = quote_plus(keyword)
+            for location in locations:
+                urls.append(f"{base_url}keywords={keyword}&location={location}&{filter_params}")
         
         self.logger.info(f"🔗 Generated {len(urls)} job search URLs")
         return urls
@@ -775,25 +813,36 @@ class EnhancedLinkedInBot:
     def should_apply_to_job(self, job_data: Dict) -> Tuple[bool, str]:
         """Determine if we should apply to this job based on filtering criteria"""
         
-        # Check blacklisted companies
-        company_name = job_data.get('company', '').lower()
-        if any(blacklisted.lower() in company_name for blacklisted in self.config.filtering.blacklisted_companies):
+        filtering = self.config.filtering
+        
+        # Check blacklisted companies ("Meta Platforms, Inc." matches "Meta", "Sapient" does not match "SAP")
+        company_name = job_data.get('company', '').casefold()
+        if filtering.company_blacklisted(company_name):
             return False, f"Company '{job_data.get('company')}' is blacklisted"
         
         # Check whitelisted companies (if specified)
-        if self.config.filtering.whitelisted_companies:
-            if not any(whitelisted.lower() in company_name for whitelisted in self.config.filtering.whitelisted_companies):
-                return False, f"Company '{job_data.get('company')}' not in whitelist"
+        if not filtering.company_whitelisted(company_name):
+            return False, f"Company '{job_data.get('company')}' not in whitelist"
         
         # Check blacklisted titles
-        job_title = job_data.get('title', '').lower()
-        if any(blacklisted.lower() in job_title for blacklisted in self.config.filtering.blacklisted_titles):
+        job_title = job_data.get('title', '').casefold()
+        if filtering.title_blacklisted(job_title):
             return False, f"Job title contains blacklisted term"
         
         # Check whitelisted titles (if specified)
-        if self.config.filtering.whitelisted_titles:
-            if not any(whitelisted.lower() in job_title for whitelisted in self.config.filtering.whitelisted_titles):
-                return False, f"Job title doesn't match whitelist"
+        if not filtering.title_whitelisted(job_title):
+            return False, f"Job title doesn't match whitelist"
+        
+        # Check skills mentioned in the description if enabled (each keyword set is scanned in one pass)
+        description = job_data.get('description', '')
+        if filtering.filter_by_skills and description and description != 'N/A':
+            description = description.casefold()
+            avoided_skill = filtering.avoided_skill_in(description)
+            if avoided_skill:
+                return False, f"Job description mentions avoided skill '{avoided_skill}'"
+            missing_skills = filtering.missing_required_skills(description)
+            if missing_skills:
+                return False, f"Job description missing required skills: {', '.join(sorted(missing_skills))}"
         
         return True, "Passed all filters"
     
@@ -1098,10 +1147,30 @@ class EnhancedLinkedInBot:
         """Fill required fields intelligently"""
         fields_filled = 0
         
+        # Read every question off the page first; the driver is only used from this thread
+        questions = []
         for field in fields:
             try:
                 label = self._get_field_label(field)
-                if self._fill_field_intelligently(field, label, job_data):
+                questions.append((field, label, self._get_field_options(field)))
+            except Exception as e:
+                self.logger.debug(f"⚠️ Error reading required field: {e}")
+        
+        # Ask the AI agent about all of them concurrently so Ollama can work on several prompts at once
+        def answer(question):
+            _, label, options = question
+            try:
+                return self.ai_agent.get_smart_answer(question=label, options=options or None, job_context=job_data).answer
+            except Exception as e:
+                self.logger.debug(f"⚠️ Error answering required field: {e}")
+                return ""
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.config.ai.concurrent_evals)) as pool:
+            answers = list(pool.map(answer, questions))
+        
+        for (field, label, options), field_answer in zip(questions, answers):
+            try:
+                if field_answer and self._fill_field_with_answer(field, label, options, field_answer):
                     fields_filled += 1
                     self.human_like_delay(0.5, 1.5)
             except Exception as e:
@@ -1163,11 +1232,7 @@ class EnhancedLinkedInBot:
     def _fill_field_intelligently(self, field, label: str, job_data: Dict) -> bool:
         """Fill field using AI agent"""
         try:
-            # Get options for select/radio fields
-            options = []
-            if field.tag_name == 'select':
-                select_obj = Select(field)
-                options = [opt.text.strip() for opt in select_obj.options if opt.text.strip()]
+            options = self._get_field_options(field)
             
             # Get AI response
             response = self.ai_agent.get_smart_answer(
@@ -1179,22 +1244,32 @@ class EnhancedLinkedInBot:
             if not response.answer:
                 return False
             
-            # Fill field based on type
-            if field.tag_name == 'select':
-                return self._fill_select_field(field, response.answer, options)
-            elif field.get_attribute('type') == 'radio':
-                return self._fill_radio_field(field, response.answer, label)
-            elif field.get_attribute('type') == 'checkbox':
-                return self._fill_checkbox_field(field, response.answer)
-            elif field.tag_name in ['input', 'textarea']:
-                return self.safe_type(field, response.answer)
-            
-            return False
+            return self._fill_field_with_answer(field, label, options, response.answer)
             
         except Exception as e:
             self.logger.debug(f"⚠️ Error filling field intelligently: {e}")
             return False
     
+    def _get_field_options(self, field) -> List[str]:
+        """Get the choices offered by a select field"""
+        if field.tag_name == 'select':
+            select_obj = Select(field)
+            return [opt.text.strip() for opt in select_obj.options if opt.text.strip()]
+        return []
+    
+    def _fill_field_with_answer(self, field, label: str, options: List[str], answer: str) -> bool:
+        """Fill field based on type"""
+        if field.tag_name == 'select':
+            return self._fill_select_field(field, answer, options)
+        elif field.get_attribute('type') == 'radio':
+            return self._fill_radio_field(field, answer, label)
+        elif field.get_attribute('type') == 'checkbox':
+            return self._fill_checkbox_field(field, answer)
+        elif field.tag_name in ['input', 'textarea']:
+            return self.safe_type(field, answer)
+        
+        return False
+    
     def _fill_select_field(self, field, answer: str, options: List[str]) -> bool:
         """Fill select field"""
         try:
@@ -1386,12 +1461,13 @@ class EnhancedLinkedInBot:
     
     def apply_to_job(self, job_url: str) -> JobApplication:
         """Apply to a single job"""
-        job_id = job_url.split('/')[-1].split('?')[0]
+        job_id = job_id_from_url(job_url) or ""
         
         try:
-            # Navigate to job
-            self.driver.get(job_url)
-            self.human_like_delay(3, 5)
+            # Navigate to job, unless it was already loaded during the delay after the previous one
+            if not job_id or job_id_from_url(self.driver.current_url) != job_id:
+                self.driver.get(job_url)
+                self.human_like_delay(3, 5)
             
             # Extract job data
             job_data = self.extract_job_data()
@@ -1525,8 +1601,16 @@ class EnhancedLinkedInBot:
                 if len(all_job_urls) >= 100:  # Limit to 100 jobs per session
                     break
             
+            # Drop jobs submitted in earlier runs (URLs without a parsable job id are always kept)
+            if self.applied_store:
+                all_job_urls = [url for url in all_job_urls if not self.applied_store.has_applied(job_id_from_url(url) or "")]
+            
             self.logger.info(f"📋 Total jobs to process: {len(all_job_urls)}")
             
+            # Plan the pauses between applications up front
+            delay_min, delay_max = self.config.application_prefs.delay_between_applications
+            delay_schedule = [random.uniform(delay_min, delay_max) for _ in all_job_urls]
+            
             # Apply to jobs
             for i, job_url in enumerate(all_job_urls):
                 # Check daily limit
@@ -1540,10 +1624,18 @@ class EnhancedLinkedInBot:
                 # Apply to job
                 application = self.apply_to_job(job_url)
                 self.applied_jobs.append(application)
+                if self.applied_store and application.job_id:
+                    self.applied_store.record(application.job_id, application.company, application.title,
+                                              application.status, application.application_date, job_url)
                 
-                # Add delay between applications
-                delay_min, delay_max = self.config.application_prefs.delay_between_applications
-                self.human_like_delay(delay_min, delay_max)
+                # Add delay between applications, loading the next job first so the wait absorbs its page load
+                if (self.config.application_prefs.prefetch_next and i + 1 < len(all_job_urls)
+                        and self.stats.successful_applications < self.config.application_prefs.max_applications_per_day):
+                    try:
+                        self.driver.get(all_job_urls[i + 1])
+                    except WebDriverException as e:
+                        self.logger.warning(f"⚠️ Could not preload next job: {e}")
+                time.sleep(delay_schedule[i])
                 
                 # Save progress periodically
                 if i % 10 == 0:
@@ -1561,6 +1653,8 @@ class EnhancedLinkedInBot:
             self.logger.error(f"❌ Session error: {e}")
         
         finally:
+            if self.applied_store:
+                self.applied_store.close()
             if self.driver:
                 self.driver.quit()
                 self.logger.info("🔚 Browser session closed")
@@ -1592,10 +1686,21 @@ class EnhancedLinkedInBot:
         
         try:
             os.makedirs(self.config.logging.data_dir, exist_ok=True)
+            export_base = f"{self.config.logging.data_dir}/applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            
+            if self.config.logging.export_format == "arrow":
+                try:
+                    arrow_file = self._export_application_arrow(export_base + ".arrow")
+                    self.logger.info(f"📄 Application data exported to: {arrow_file}")
+                    return
+                except ImportError:
+                    self.logger.warning("⚠️ pyarrow not installed, exporting application data as CSV")
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Arrow export failed ({e}), exporting application data as CSV")
             
             # CSV export
             import csv
-            csv_file = f"{self.config.logging.data_dir}/applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            csv_file = export_base + ".csv"
             
             with open(csv_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
@@ -1615,6 +1720,34 @@ class EnhancedLinkedInBot:
             
         except Exception as e:
             self.logger.error(f"❌ Error exporting application data: {e}")
+    
+    def _export_application_arrow(self, arrow_file: str, batch_size: int = 64) -> str:
+        """Write applied jobs as an Arrow IPC file in record batches"""
+        import pyarrow as pa
+        
+        schema = pa.schema([
+            ('job_id', pa.large_string()),
+            ('title', pa.large_string()),
+            ('company', pa.large_string()),
+            ('location', pa.large_string()),
+            ('salary', pa.large_string()),
+            ('posted_date', pa.large_string()),
+            ('application_date', pa.timestamp('ns')),
+            ('status', pa.large_string()),
+            ('reason', pa.large_string()),
+            ('form_fields_filled', pa.int32()),
+            ('application_url', pa.large_string()),
+        ])
+        
+        with pa.OSFile(arrow_file, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            for start in range(0, len(self.applied_jobs), batch_size):
+                batch = self.applied_jobs[start:start + batch_size]
+                writer.write_batch(pa.record_batch(
+                    [[getattr(app, field.name) for app in batch] for field in schema],
+                    schema=schema
+                ))
+        
+        return arrow_file
 
 def main():
     """Main entry point"""
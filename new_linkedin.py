@@ -6,24 +6,256 @@ import platform
 import json
 import requests
 import re
+from dataclasses import dataclass
+from itertools import islice
+from urllib.parse import urlencode
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, StaleElementReferenceException,
+    ElementNotInteractableException, ElementClickInterceptedException
+)
 from selenium.webdriver.common.keys import Keys
 import utils
 import constants
 import config
+from enhanced_utils import job_id_from_url
 import undetected_chromedriver as uc
 
+# Markdown code fence around a model's JSON answer; the closing fence may be missing
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.S)
+
+# Labels that belong to upload/search/alert widgets rather than application questions
+_SKIP_QUESTION_RE = re.compile('|'.join(map(re.escape, [
+    'upload', 'resume', 'cover letter', 'search', 'alert', 'deselect',
+    'select resume', 'set alert', 'choose file', 'browse'
+])))
+
+# Field labels that are not part of the application form
+_SKIP_FIELD_RE = re.compile('|'.join(map(re.escape, [
+    'search', 'upload', 'browse', 'choose file', 'resume', 'cover letter',
+    'alert', 'notification', 'email alert', 'job alert', 'deselect', 'select resume',
+    'find', 'location search', 'company search', 'search-global-typeahead'
+])))
+
+# ID/name/class fragments of search, typeahead and navigation inputs
+_SEARCH_FIELD_RE = re.compile('|'.join(map(re.escape, [
+    'search', 'typeahead', 'autocomplete', 'find', 'lookup',
+    'jobs-search', 'search-box', 'query', 'keyword', 'filter',
+    'jobs-location', 'location-search', 'company-search',
+    'single-typeahead', 'search-typeahead', 'combobox-input',
+    'search-global-typeahead', 'global-nav', 'nav-search'
+])))
+
+# Label words that mark a text field as an application question
+_INCLUDE_LABEL_RE = re.compile('|'.join(map(re.escape, [
+    'experience', 'years', 'authorized', 'eligible', 'visa',
+    'sponsorship', 'degree', 'bachelor', 'commut', 'willing',
+    'available', 'salary', 'notice', 'start', 'agree', 'terms',
+    'onsite', 'remote', 'work', 'location', 'city', 'country'
+])))
+
+# Labels of search/navigation inputs picked up by the validation-error fallback scan
+_SKIP_ERROR_LABEL_RE = re.compile('|'.join(map(re.escape, [
+    'search', 'find', 'lookup', 'filter', 'keyword', 'query',
+    'location search', 'company search', 'job search', 'global search',
+    'search jobs', 'search companies', 'search people'
+])))
+
+# Classifies a validation error as pointing at a dropdown or at an agreement checkbox in one
+# search. The anchored lookaheads keep the old priority: any dropdown keyword wins.
+_ERROR_KIND_RE = re.compile(
+    r'^(?:(?=.*?(?P<dropdown>select an option|professional|conversational|native|bilingual))'
+    r'|(?=.*?(?P<checkbox>checkbox|check this box|agree|terms|privacy policy)))',
+    re.S
+)
+
+# Words that mark a line of nearby text as a checkbox's agreement label
+_AGREEMENT_LINE_RE = re.compile('agree|terms|privacy|policy|checkbox')
+
+# Placeholder texts of dropdowns that have no real selection yet
+_PLACEHOLDER_OPTIONS = frozenset(['select an option', 'select', 'choose', 'please select', '', '--', 'none'])
+
+# Fields LinkedIn marks as invalid, matched with a single comma-joined CSS query
+_ERROR_FIELD_SELECTOR = ", ".join([
+    "input[aria-invalid='true']",
+    "textarea[aria-invalid='true']",
+    "select[aria-invalid='true']",
+    ".artdeco-text-input--error input",
+    ".form-element--error input",
+    ".form-element--error textarea",
+    ".form-element--error select",
+    ".jobs-easy-apply-form-element--error input",
+    ".jobs-easy-apply-form-element--error textarea",
+    ".jobs-easy-apply-form-element--error select",
+    "input[class*='error']",
+    "select[class*='error']",
+    "textarea[class*='error']"
+])
+
+# Fallback scan when errors are shown but no field is marked - most likely culprits first
+_FALLBACK_FIELD_ORDER = ('select', 'text', 'number', 'tel', 'email', 'textarea', 'radio', 'checkbox')
+_FALLBACK_FIELD_SELECTOR = ", ".join(
+    tag if tag in ('select', 'textarea') else f"input[type='{tag}']" for tag in _FALLBACK_FIELD_ORDER
+)
+
+# Agreement checkboxes for errors like "Select checkbox to proceed", matched with one query
+_AGREEMENT_CHECKBOX_SELECTOR = ", ".join([
+    "input[type='checkbox']",
+    "input[type='checkbox']:not(:checked)",
+    "[role='checkbox']",
+    "input[type='checkbox'][required]",
+    "input[type='checkbox'][aria-required='true']"
+])
+
+# Inline validation messages that sit next to the field they belong to
+_ERROR_MESSAGE_SELECTOR = ", ".join([
+    ".artdeco-inline-feedback--error",
+    ".form-element-validation-error",
+    "[role='alert']",
+    ".jobs-easy-apply-form-element__error",
+    "[class*='error'][class*='message']",
+    "[class*='validation'][class*='error']"
+])
+
+# Elements that show the application is at its review/submit step (CSS, or XPath when starting with //)
+_FINAL_STEP_INDICATORS = [
+    "button[aria-label='Submit application']",
+    "button[aria-label='Review your application']",
+    "//button[contains(text(), 'Submit application')]",
+    "//button[contains(text(), 'Submit Application')]",
+    "//button[contains(text(), 'Review')]",
+    "//button[contains(text(), 'Submit')]",
+    ".jobs-easy-apply-footer button[data-easy-apply-submit-button]",
+    "button[data-test-modal-close-btn]",  # Sometimes the X button indicates completion
+    "//span[contains(text(), 'Application sent')]"  # Success message
+]
+
+# Buttons to try when the regular Next/Continue button is missing, in priority order
+_ALT_NAVIGATION_BUTTONS = [
+    "//button[contains(text(), 'Review')]",
+    "//button[contains(text(), 'Review your application')]",
+    "//button[contains(text(), 'Submit application')]",
+    "//button[contains(text(), 'Submit Application')]",
+    "//button[contains(text(), 'Submit')]",
+    "//button[contains(text(), 'Apply')]",
+    "//button[contains(text(), 'Send application')]",
+    "//button[contains(text(), 'Skip')]",
+    ".jobs-easy-apply-footer button:not([disabled])",
+    "button[aria-label='Review your application']",
+    "button[aria-label='Submit application']"
+]
+
+# Locator pairs for the final submission flow, classified once instead of per call
+_REVIEW_BUTTONS = (
+    (By.XPATH, "//button[contains(text(), 'Review')]"),
+    (By.XPATH, "//button[contains(text(), 'Review your application')]"),
+    (By.CSS_SELECTOR, "button[aria-label='Review your application']")
+)
+
+_FOLLOW_CHECKBOXES = (
+    (By.CSS_SELECTOR, "input[id*='follow']"),
+    (By.CSS_SELECTOR, "label[for*='follow'] input"),
+    (By.CSS_SELECTOR, "input[type='checkbox'][id*='follow']"),
+    (By.XPATH, "//label[contains(text(), 'follow')]/input"),
+    (By.XPATH, "//input[@type='checkbox' and contains(@aria-label, 'follow')]")
+)
+
+_SUBMIT_BUTTONS = (
+    (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
+    (By.CSS_SELECTOR, "button[data-easy-apply-submit-button]"),
+    (By.XPATH, "//button[contains(text(), 'Submit application')]"),
+    (By.XPATH, "//button[contains(text(), 'Submit Application')]"),
+    (By.XPATH, "//button[contains(text(), 'Send application')]"),
+    (By.XPATH, "//button[contains(text(), 'Apply now')]"),
+    (By.XPATH, "//button[contains(text(), 'Submit')]"),
+    (By.XPATH, "//button[contains(text(), 'Apply')]"),
+    (By.CSS_SELECTOR, ".jobs-easy-apply-footer button[type='submit']"),
+    (By.CSS_SELECTOR, "button[type='submit']:not([disabled])"),
+    (By.XPATH, "//button[@type='submit' and not(@disabled)]")
+)
+
+# Confirmation wording shown once an application has gone through, matched against the modal text
+_SUCCESS_RE = re.compile(r"application (?:sent|submitted)|was sent|successfully", re.I)
+
+_EASY_APPLY_BUTTONS = (
+    (By.CSS_SELECTOR, "button[aria-label*='Easy Apply']"),
+    (By.XPATH, "//button[contains(text(), 'Easy Apply')]"),
+    (By.CSS_SELECTOR, ".jobs-apply-button"),
+    (By.CSS_SELECTOR, "button[data-job-id]")
+)
+
+# Job page top-card fields as (key, By, selector); later entries for a key are fallbacks
+_JOB_PROPERTY_LOCATORS = (
+    ('title', By.CSS_SELECTOR, "h1"),
+    ('company', By.CSS_SELECTOR, ".jobs-unified-top-card__company-name a, .jobs-unified-top-card__company-name"),
+    ('location', By.CSS_SELECTOR, ".jobs-unified-top-card__bullet"),
+    ('workplace', By.CSS_SELECTOR, ".jobs-unified-top-card__workplace-type"),
+    ('posted_date', By.CSS_SELECTOR, ".jobs-unified-top-card__posted-date"),
+    ('posted_date', By.XPATH, "//span[contains(text(), 'ago')]"),
+    ('applications', By.CSS_SELECTOR, ".jobs-unified-top-card__applicant-count")
+)
+
+# What a click on an element found a moment ago can legitimately fail with
+_CLICK_ERRORS = (StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException)
+
+@dataclass(frozen=True)
+class _ConfigSnapshot:
+    """Settings read from config once at startup, so per-job and per-question code skips getattr lookups"""
+    follow_companies: bool = False
+    experience_years: str = '4'
+    visa_status: str = 'Indian Citizen'
+    willing_to_relocate: bool = True
+    phone_number: str = '+91-9876543210'
+    notice_period: str = '30 days'
+    current_salary: str = '18'  # INR LPA
+    salary_expectation: str = '27'  # INR LPA
+    locations: tuple = ('Europe',)
+    keywords: tuple = ('Software Engineer',)
+    experience_levels: tuple = ('Mid-Senior level',)
+    job_types: tuple = ('Full-time',)
+    remote: tuple = ('On-site',)
+
+    @classmethod
+    def from_config(cls):
+        defaults = cls()
+
+        def as_tuple(name, default):
+            value = getattr(config, name, default)
+            return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+        return cls(
+            follow_companies=getattr(config, 'followCompanies', defaults.follow_companies),
+            experience_years=str(getattr(config, 'experience_years', defaults.experience_years)),
+            visa_status=getattr(config, 'visa_status', defaults.visa_status),
+            willing_to_relocate=getattr(config, 'willing_to_relocate', defaults.willing_to_relocate),
+            phone_number=getattr(config, 'phone_number', defaults.phone_number),
+            notice_period=getattr(config, 'notice_period', defaults.notice_period),
+            current_salary=getattr(config, 'current_salary', defaults.current_salary),
+            salary_expectation=getattr(config, 'salary_expectation', defaults.salary_expectation),
+            locations=as_tuple('location', defaults.locations),
+            keywords=as_tuple('keywords', defaults.keywords),
+            experience_levels=as_tuple('experienceLevels', defaults.experience_levels),
+            job_types=as_tuple('jobType', defaults.job_types),
+            remote=as_tuple('remote', defaults.remote)
+        )
+
 class AIAgent:
     def __init__(self, ollama_url="http://localhost:11434", model="qwen2.5:7b", cv_path="cv.pdf"):
         self.ollama_url = ollama_url
         self.model = model
         self.cv_path = cv_path
+        self.cfg = _ConfigSnapshot.from_config()
+        # One keep-alive connection to Ollama for every request instead of a new one per call
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
         self.cv_text = self.extract_cv_text()
+        self._cv_analysis = None
         self.cv_data = self.parse_cv_with_ai()
         print(f"🤖 CV Analysis Complete! Extracted {len(self.cv_data.get('skills', []))} skills and other details.")
         
@@ -144,7 +376,9 @@ Extract and return ONLY a valid JSON object with these fields:
     "achievements": ["Array", "of", "key", "achievements"],
     "linkedin_url": "LinkedIn profile URL if mentioned",
     "github_url": "GitHub profile URL if mentioned",
-    "portfolio_url": "Portfolio website URL if mentioned"
+    "portfolio_url": "Portfolio website URL if mentioned",
+    "job_keywords": ["Array", "of", "10", "relevant", "LinkedIn", "job", "search", "titles"],
+    "summary": "Two sentence professional summary"
 }}
 
 Important: 
@@ -154,7 +388,7 @@ Important:
 - Return only valid JSON, no extra text
 """
 
-            response = requests.post(f"{self.ollama_url}/api/generate", 
+            response = self.session.post(f"{self.ollama_url}/api/generate", 
                                    json={
                                        "model": self.model,
                                        "prompt": prompt,
@@ -170,10 +404,9 @@ Important:
                 result = response.json()['response'].strip()
                 
                 # Clean up the response to extract JSON
-                if '```json' in result:
-                    result = result.split('```json')[1].split('```')[0]
-                elif '```' in result:
-                    result = result.split('```')[1].split('```')[0]
+                fence = _FENCE_RE.search(result)
+                if fence:
+                    result = fence.group(1)
                 
                 # Try to parse JSON
                 try:
@@ -209,6 +442,79 @@ Important:
         # Fallback to manual parsing
         return self.manual_cv_parsing()
     
+    def analyze_cv_multi(self):
+        """Return AI job search keywords for the CV, asking for skills, keywords and summary in one request"""
+        if self._cv_analysis is None:
+            # The initial CV parse already asks for these fields, so only re-prompt when it fell back
+            if isinstance(self.cv_data.get('job_keywords'), list) and self.cv_data['job_keywords']:
+                analysis = {
+                    'skills': self.cv_data.get('skills', []),
+                    'job_keywords': self.cv_data['job_keywords'],
+                    'summary': self.cv_data.get('summary', '')
+                }
+            else:
+                analysis = self._request_cv_analysis()
+            
+            # Only keep a usable answer, so an unreachable or confused model is asked again next time
+            if not isinstance(analysis, dict) or not isinstance(analysis.get('job_keywords'), list):
+                return []
+            self._cv_analysis = analysis
+        return self._cv_analysis['job_keywords']
+    
+    def _request_cv_analysis(self):
+        """Single multi-task prompt over the CV; returns an empty dict when the model is unavailable"""
+        prompt = f"""
+Analyze this professional profile and answer all tasks in ONE JSON object:
+
+CV Text:
+{self.cv_text}
+
+Experience: {self.cv_data.get('experience_years', '0')} years
+Current Title: {self.cv_data.get('current_title', 'Software Developer')}
+Location: {self.cv_data.get('location', 'India')}
+
+Return ONLY a valid JSON object with these fields:
+{{
+    "skills": ["Array", "of", "technical", "skills"],
+    "job_keywords": ["10 relevant LinkedIn job search keywords and titles, like", "Python Developer", "Backend Developer"],
+    "summary": "Two sentence professional summary"
+}}
+"""
+        try:
+            # Stream the answer so we can hang up as soon as the JSON object is complete;
+            # closing the response makes Ollama stop generating whatever the model adds after it
+            with self.session.post(f"{self.ollama_url}/api/generate", 
+                                   json={
+                                       "model": self.model,
+                                       "prompt": prompt,
+                                       "stream": True,
+                                       "options": {"temperature": 0.2}
+                                   }, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    return {}
+                
+                result = ''
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    piece = chunk.get('response', '')
+                    result += piece
+                    
+                    # Any code fence before the object is skipped by starting at the first brace
+                    start = result.find('{')
+                    if '}' in piece and start != -1:
+                        try:
+                            analysis, _ = json.JSONDecoder().raw_decode(result, start)
+                            return analysis
+                        except ValueError:
+                            pass
+                    if chunk.get('done'):
+                        break
+        except Exception as e:
+            print(f"❌ Error analyzing CV: {e}")
+        return {}
+    
     def manual_cv_parsing(self):
         """Fallback manual CV parsing using regex and keywords"""
         cv_data = {
@@ -327,7 +633,7 @@ Important:
                     print(f"🤖 Yes/No dropdown detected - Being strategic...")
                     
                     # VISA/SPONSORSHIP questions - Answer based on config visa_status
-                    visa_status = getattr(config, 'visa_status', 'Indian Citizen')
+                    visa_status = self.cfg.visa_status
                     
                     if any(word in question.lower() for word in ['authorized', 'eligible', 'citizen']):
                         # Work authorization based on visa status
@@ -375,7 +681,7 @@ Important:
                     
                     # RELOCATION questions - Based on config
                     elif any(word in question.lower() for word in ['relocate', 'move', 'willing to travel']):
-                        willing_to_relocate = getattr(config, 'willing_to_relocate', True)
+                        willing_to_relocate = self.cfg.willing_to_relocate
                         if willing_to_relocate:
                             print(f"🔍 Relocation question -> Yes (willing to relocate)")
                             return yes_options[0]
@@ -396,7 +702,7 @@ Important:
                             return option
                 else:
                     # Return actual phone number without country code
-                    phone = getattr(config, 'phone_number', '+91-9876543210')
+                    phone = self.cfg.phone_number
                     # Remove country code if present for phone number field
                     if phone.startswith('+91'):
                         return phone[3:].replace('-', '')  # Remove +91 and dashes
@@ -404,7 +710,7 @@ Important:
             
             # Handle notice period questions with smart format detection
             if any(word in question.lower() for word in ['notice', 'joining', 'availability', 'when can you start']):
-                notice_period = getattr(config, 'notice_period', '30 days')
+                notice_period = self.cfg.notice_period
                 
                 # If error message doesn't specify numeric format, it's likely a text field
                 if error_message and not any(word in error_message.lower() for word in ['number', 'decimal', 'integer', 'digit', 'numeric']):
@@ -419,8 +725,8 @@ Important:
             
             # Handle salary questions with smart currency and format detection
             if any(word in question.lower() for word in ['salary', 'ctc', 'compensation', 'pay', 'wage']):
-                current_salary = getattr(config, 'current_salary', '18')  # INR LPA
-                expected_salary = getattr(config, 'salary_expectation', '27')  # INR LPA
+                current_salary = self.cfg.current_salary  # INR LPA
+                expected_salary = self.cfg.salary_expectation  # INR LPA
                 
                 # Detect currency context
                 is_usd = 'usd' in question.lower() or '$' in question.lower() or 'dollar' in question.lower()
@@ -504,8 +810,8 @@ My Profile:
 - Name: {self.cv_data.get('name', 'Aman Kumar')} 
 - Experience: {self.cv_data.get('experience_years', '4')} years
 - Location: {self.cv_data.get('location', 'India')}
-- Current Salary: {getattr(config, 'current_salary', '18')} LPA
-- Expected Salary: {getattr(config, 'salary_expectation', '27')} LPA
+- Current Salary: {self.cfg.current_salary} LPA
+- Expected Salary: {self.cfg.salary_expectation} LPA
 - Visa Status: Indian Citizen (need sponsorship)
 - Education: Bachelor's Degree
 - English: Professional level
@@ -560,7 +866,7 @@ Examples:
 - Years: Just the number
 """
 
-            response = requests.post(f"{self.ollama_url}/api/generate", 
+            response = self.session.post(f"{self.ollama_url}/api/generate", 
                                    json={
                                        "model": self.model,
                                        "prompt": prompt,
@@ -619,12 +925,35 @@ class StealthLinkedin:
         # Initialize AI Agent with CV analysis
         cv_path = getattr(config, 'cv_path', 'cv.pdf')  # Allow custom CV path in config
         self.ai_agent = AIAgent(cv_path=cv_path)
+        self.cfg = self.ai_agent.cfg
+        
+        # Output directory for generated URL lists and results
+        os.makedirs('data', exist_ok=True)
+        
+        # Lazily created ActionChains instance, reused across click fallbacks
+        self._actions = None
+        
+        # Field labels resolved on the current form step, keyed by WebElement id
+        self._label_cache = {}
+        
+        # Easy Apply modal located once per step; field queries are scoped to it
+        self._easy_apply_root = None
         
         if browser == "firefox":
             self.setup_firefox_driver()
         elif browser == "chrome":
             self.setup_chrome_driver()
         
+        # Short explicit wait for step transitions - bounded by the old fixed sleeps, returns as soon as the DOM moves
+        self._step_wait = WebDriverWait(self.driver, 3, poll_frequency=0.2)
+        
+        # Longer wait for things that appear after a submit (success message)
+        self._page_wait = WebDriverWait(self.driver, 8, poll_frequency=0.25)
+        
+        # The job page has already had its load delay when the Easy Apply button is looked up, so only
+        # allow a short grace period - jobs without the button (applied, external apply) are common
+        self._button_wait = WebDriverWait(self.driver, 2, poll_frequency=0.25)
+        
         if len(linkedinEmail) > 0:
             self.stealth_login(linkedinEmail)
     
@@ -685,6 +1014,18 @@ class StealthLinkedin:
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
         
+    def wait_for_step_change(self, button=None):
+        """Wait until a clicked button goes stale, or the next step's footer button shows up, then jitter briefly"""
+        try:
+            if button is not None:
+                self._step_wait.until(EC.staleness_of(button))
+            else:
+                self._step_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR,
+                    "button[aria-label^='Continue'], button[aria-label^='Review'], button[aria-label^='Submit']")))
+        except TimeoutException:
+            pass
+        self.human_like_delay(0.2, 0.6)  # Keep a little randomness for stealth
+        
     def human_like_typing(self, element, text, typing_delay=0.1):
         """Type with human-like delays between characters"""
         try:
@@ -763,8 +1104,6 @@ class StealthLinkedin:
                 self.human_like_delay(0.5, 1)
                 
                 # Wait for element to be interactable
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
                 
                 wait = WebDriverWait(self.driver, 10)
                 wait.until(EC.element_to_be_clickable(element))
@@ -954,22 +1293,17 @@ class StealthLinkedin:
     def fill_form_field(self, element, question_text, job_context="", force_fill=False):
         """Fill form field using AI agent with flexible input type handling"""
         try:
-            # Check if field already has a value
-            current_value = element.get_attribute('value')
-            tag_name = element.tag_name.lower()
+            # Check if field already has a value - emptiness is computed in the browser
+            state = self._read_field_state(element)
+            tag_name = state['tag']
             
             # For select elements, check if a meaningful option is selected
             if tag_name == "select":
-                try:
-                    select = Select(element)
-                    selected_option = select.first_selected_option.text.strip()
-                    if selected_option and selected_option.lower() not in ['select', 'choose', 'please select', '', '--']:
-                        print(f"⏭️ Dropdown already has selection: {selected_option}")
-                        return False
-                except:
-                    pass
-            elif current_value and current_value.strip() and not force_fill:
-                print(f"⏭️ Field already filled: {question_text[:30]}... -> {current_value[:20]}...")
+                if not state['empty']:
+                    print(f"⏭️ Dropdown already has selection: {state['selectedText']}")
+                    return False
+            elif not state['empty'] and not force_fill:
+                print(f"⏭️ Field already filled: {question_text[:30]}... -> {state['value'][:20]}...")
                 return False
             
             print(f"🔧 Attempting to fill: {question_text[:50]}...")
@@ -981,7 +1315,7 @@ class StealthLinkedin:
                 print(f"🤖 AI Response: {ai_response[:50]}...")
                 
                 # Check element type
-                input_type = element.get_attribute('type') if tag_name == 'input' else None
+                input_type = state['type'] if tag_name == 'input' else None
                 
                 if tag_name == "select":
                     # Handle dropdown selection with better matching
@@ -1128,47 +1462,47 @@ class StealthLinkedin:
             name = element.get_attribute('name')
             if not name:
                 # Try to find radio group by looking at nearby elements
-                parent = element.find_element(By.XPATH, "./..")
-                radio_group = parent.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+                radio_group = self.driver.execute_script(
+                    "return Array.from(arguments[0].parentNode.querySelectorAll(\"input[type='radio']\"))"
+                    ".filter(function(e) { return e.offsetParent !== null; });", element)
             else:
-                radio_group = self.driver.find_elements(By.CSS_SELECTOR, f"input[type='radio'][name='{name}']")
+                radio_group = self._visible_query(f"input[type='radio'][name='{name}']")
             
             options = []
             
             for radio in radio_group:
-                if radio.is_displayed():
-                    # Try multiple ways to get the radio button label
-                    label = None
-                    
-                    # Method 1: Check for associated label
-                    radio_id = radio.get_attribute('id')
-                    if radio_id:
-                        try:
-                            label_elem = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{radio_id}']")
-                            label = label_elem.text.strip()
-                        except:
-                            pass
-                    
-                    # Method 2: Look for label in parent element
-                    if not label:
-                        try:
-                            parent = radio.find_element(By.XPATH, "./..")
-                            # Look for span or div with text near the radio button
-                            text_elements = parent.find_elements(By.CSS_SELECTOR, "span, div, label")
-                            for elem in text_elements:
-                                text = elem.text.strip()
-                                if text and len(text) < 20 and text.lower() in ['yes', 'no']:
-                                    label = text
-                                    break
-                        except:
-                            pass
-                    
-                    # Method 3: Use value attribute as fallback
-                    if not label:
-                        label = radio.get_attribute('value') or ""
-                    
-                    if label:
-                        options.append((radio, label))
+                # Try multiple ways to get the radio button label
+                label = None
+                
+                # Method 1: Check for associated label
+                radio_id = radio.get_attribute('id')
+                if radio_id:
+                    try:
+                        label_elem = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{radio_id}']")
+                        label = label_elem.text.strip()
+                    except:
+                        pass
+                
+                # Method 2: Look for label in parent element
+                if not label:
+                    try:
+                        parent = radio.find_element(By.XPATH, "./..")
+                        # Look for span or div with text near the radio button
+                        text_elements = parent.find_elements(By.CSS_SELECTOR, "span, div, label")
+                        for elem in text_elements:
+                            text = elem.text.strip()
+                            if text and len(text) < 20 and text.lower() in ['yes', 'no']:
+                                label = text
+                                break
+                    except:
+                        pass
+                
+                # Method 3: Use value attribute as fallback
+                if not label:
+                    label = radio.get_attribute('value') or ""
+                
+                if label:
+                    options.append((radio, label))
             
             if not options:
                 print(f"⚠️ No radio options found for: {question_text[:30]}...")
@@ -1231,30 +1565,30 @@ class StealthLinkedin:
                 best_match = None
                 best_score = 0
                 
+                # Tokenize the AI choice once instead of per radio option
+                chosen_lower = chosen_option.lower()
+                chosen_set = set(chosen_lower.split())
+                
                 for radio, label in options:
-                    score = 0
-                    chosen_words = chosen_option.lower().split()
-                    label_words = label.lower().split()
+                    label_lower = label.lower()
                     
                     # Exact match gets highest score
-                    if chosen_option.lower() == label.lower():
+                    if chosen_lower == label_lower:
                         score = 100
                     # Partial matches
-                    elif chosen_option.lower() in label.lower() or label.lower() in chosen_option.lower():
+                    elif chosen_lower in label_lower or label_lower in chosen_lower:
                         score = 50
-                    # Word matches
+                    # Word matches, weighted by word length
                     else:
-                        common_words = set(chosen_words) & set(label_words)
-                        score = len(common_words) * 10
-                        
-                        # Individual word matches
-                        for word in chosen_words:
-                            if word in label.lower():
-                                score += len(word)
+                        common_words = chosen_set & set(label_lower.split())
+                        score = len(common_words) * 10 + sum(len(word) for word in common_words)
                     
                     if score > best_score:
                         best_match = radio
                         best_score = score
+                        # Nothing can beat an exact match
+                        if best_score >= 100:
+                            break
                 
                 if best_match:
                     # Find the label for the best match
@@ -1314,8 +1648,7 @@ class StealthLinkedin:
             
             # Strategy 4: Click parent container
             try:
-                parent = radio_element.find_element(By.XPATH, "./..")
-                parent.click()
+                self.driver.execute_script("arguments[0].parentNode.click();", radio_element)
                 print(f"✅ Parent container click successful")
                 return True
             except Exception as e:
@@ -1323,9 +1656,9 @@ class StealthLinkedin:
             
             # Strategy 5: Use ActionChains
             try:
-                from selenium.webdriver.common.action_chains import ActionChains
-                actions = ActionChains(self.driver)
-                actions.move_to_element(radio_element).click().perform()
+                if self._actions is None:
+                    self._actions = ActionChains(self.driver)
+                self._actions.move_to_element(radio_element).click().perform()
                 print(f"✅ ActionChains click successful")
                 return True
             except Exception as e:
@@ -1402,8 +1735,7 @@ class StealthLinkedin:
             
             # Strategy 4: Click parent container
             try:
-                parent = checkbox_element.find_element(By.XPATH, "./..")
-                parent.click()
+                self.driver.execute_script("arguments[0].parentNode.click();", checkbox_element)
                 print(f"✅ Checkbox parent container click successful")
                 return True
             except Exception as e:
@@ -1438,7 +1770,7 @@ class StealthLinkedin:
             
             # Fallback: if it's asking for experience and we couldn't parse, use default
             if 'experience' in question_text.lower():
-                default_exp = str(getattr(config, 'experience_years', '4'))
+                default_exp = self.cfg.experience_years
                 if self.safe_element_interaction(element, "type", default_exp):
                     print(f"✅ Entered fallback experience: {default_exp}")
                     return True
@@ -1522,6 +1854,18 @@ class StealthLinkedin:
             print(f"❌ Text input error: {e}")
             return False
 
+    def _page_fingerprint(self):
+        """Cheap change-detection token computed in the browser instead of pulling page_source"""
+        try:
+            return self.driver.execute_script("""
+                var text = document.body ? (document.body.innerText || '') : '';
+                var modal = document.querySelector('.jobs-easy-apply-content, .artdeco-modal__content');
+                var modalText = modal ? (modal.innerText || '').slice(0, 400) : '';
+                return text.length + ':' + document.title + ':' + location.href + ':' + modalText;
+            """)
+        except:
+            return None
+
     def try_next_step_without_filling(self):
         """Try to proceed to next step without filling any fields"""
         continue_btns = [
@@ -1545,7 +1889,7 @@ class StealthLinkedin:
         
         # Get current page state to detect if we actually moved forward
         initial_url = self.driver.current_url
-        initial_page_source_hash = hash(self.driver.page_source[:1000])  # Hash first 1000 chars for comparison
+        initial_fingerprint = self._page_fingerprint()
         
         for btn_selector in continue_btns:
             try:
@@ -1564,10 +1908,11 @@ class StealthLinkedin:
                         
                         # Check if page actually changed
                         new_url = self.driver.current_url
-                        new_page_source_hash = hash(self.driver.page_source[:1000])
+                        new_fingerprint = self._page_fingerprint()
                         
-                        if new_url != initial_url or new_page_source_hash != initial_page_source_hash:
+                        if new_url != initial_url or new_fingerprint != initial_fingerprint:
                             print(f"✅ Clicked '{button_text}' - Page changed successfully")
+                            self._label_cache.clear()  # New step, new fields
                             return True
                         else:
                             print(f"⚠️ Clicked '{button_text}' but page didn't change - may have validation errors")
@@ -1578,6 +1923,7 @@ class StealthLinkedin:
                                 return False  # Don't claim success if there are validation errors
                             else:
                                 print(f"✅ Clicked '{button_text}' - No visible errors, assuming success")
+                                self._label_cache.clear()
                                 return True
             except Exception as e:
                 continue
@@ -1585,6 +1931,60 @@ class StealthLinkedin:
         print("❌ No working next button found")
         return False
 
+    def _locate_easy_apply_root(self):
+        """Locate the Easy Apply modal for the current step, or None to search the whole document"""
+        try:
+            self._easy_apply_root = self.driver.find_element(By.CSS_SELECTOR, ".jobs-easy-apply-modal, .artdeco-modal")
+        except:
+            self._easy_apply_root = None
+        return self._easy_apply_root
+
+    def _run_scoped(self, script, *args):
+        """Run a script that receives the search root as its last argument, dropping a stale root"""
+        if self._easy_apply_root is not None:
+            try:
+                return self.driver.execute_script(script, *args, self._easy_apply_root)
+            except:
+                self._easy_apply_root = None
+        return self.driver.execute_script(script, *args, None)
+
+    def _visible_query(self, css):
+        """Return only the visible elements matching a CSS selector, filtered in the browser"""
+        return self._run_scoped(
+            "return Array.from((arguments[1] || document).querySelectorAll(arguments[0]))"
+            ".filter(function(e) { return e.offsetParent !== null; });", css) or []
+
+    def _first_visible(self, selectors, require_enabled=False):
+        """Return [selector, element] for the first selector (CSS, // XPath or a (By, selector) pair) whose first match is visible, in one call"""
+        try:
+            return self.driver.execute_script("""
+                var selectors = arguments[0], requireEnabled = arguments[1];
+                for (var i = 0; i < selectors.length; i++) {
+                    var selector = selectors[i], el;
+                    var isPair = Array.isArray(selector);
+                    var query = isPair ? selector[1] : selector;
+                    if (isPair ? selector[0] === 'xpath' : query.indexOf('//') === 0) {
+                        el = document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                    } else {
+                        el = document.querySelector(query);
+                    }
+                    if (el && (el.offsetParent !== null || el.getClientRects().length) && !(requireEnabled && el.disabled)) {
+                        return [selector, el];
+                    }
+                }
+                return null;
+            """, selectors, require_enabled)
+        except WebDriverException:
+            return None
+
+    def _visible_only(self, elements):
+        """Filter already-found elements down to the visible ones in one call"""
+        if not elements:
+            return []
+        return self.driver.execute_script(
+            "return arguments[0].filter(function(e) { return !!(e.offsetParent || e.getClientRects().length); });",
+            list(elements)) or []
+
     def get_form_errors(self):
         """Detect form validation errors"""
         error_selectors = [
@@ -1597,153 +1997,192 @@ class StealthLinkedin:
             ".artdeco-inline-feedback[data-test-form-element-feedback-type='ERROR']"
         ]
         
-        errors = []
-        for selector in error_selectors:
-            try:
-                error_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in error_elements:
-                    if elem.is_displayed():
-                        error_text = elem.text.strip()
-                        if error_text:
-                            errors.append(error_text)
-            except:
-                continue
-        
-        return errors
+        try:
+            # Collect visible error texts for every selector in one browser round-trip
+            errors = self.driver.execute_script("""
+                var out = [];
+                arguments[0].forEach(function(selector) {
+                    document.querySelectorAll(selector).forEach(function(el) {
+                        var text = (el.innerText || '').trim();
+                        if (el.offsetParent !== null && text) out.push(text);
+                    });
+                });
+                return out;
+            """, error_selectors)
+            return errors or []
+        except:
+            return []
+
+    # Field priority for find_all_form_fields - more important ones first
+    _FIELD_TYPE_ORDER = ('radio', 'checkbox', 'dropdown', 'number', 'textarea', 'text', 'email', 'phone')
+
+    def _scan_form_fields_js(self):
+        """Scan every visible form field once in the browser and return its metadata and flags"""
+        return self.driver.execute_script("""
+            var placeholders = ['', 'select', 'choose', 'please select'];
+            var modalSelector = "[data-test-modal-id*='easy-apply'], [class*='jobs-easy-apply']";
+            // Resolve the Easy Apply modal root once; fields are then checked with a cheap contains()
+            var modalRoot = document.querySelector("[data-test-modal-id*='easy-apply']");
+            
+            function inModal(el) {
+                return modalRoot ? modalRoot.contains(el) : !!el.closest(modalSelector);
+            }
+            
+            function isVisible(el) {
+                return el.offsetParent !== null;
+            }
+            
+            function isEmpty(el) {
+                if (el.tagName.toLowerCase() === 'select') {
+                    var selected = el.selectedOptions[0];
+                    return !selected || placeholders.indexOf(selected.text.trim().toLowerCase()) !== -1;
+                }
+                return !(el.value || '').trim();
+            }
+            
+            function isField(el) {
+                return el && ['input', 'select', 'textarea'].indexOf(el.tagName.toLowerCase()) !== -1 && isVisible(el);
+            }
+            
+            // Map fields to the text of their asterisk (*) label - these are definitely required
+            var asteriskLabels = new Map();
+            document.querySelectorAll('label').forEach(function(label) {
+                var text = (label.innerText || '').trim();
+                if (!isVisible(label) || text.indexOf('*') === -1) return;
+                
+                var field = label.htmlFor ? document.getElementById(label.htmlFor) : null;
+                if (!field && label.parentElement) {
+                    field = Array.from(label.parentElement.querySelectorAll('input, select, textarea')).find(isVisible);
+                }
+                if (!field) {
+                    for (var sib = label.nextElementSibling; sib; sib = sib.nextElementSibling) {
+                        if (isField(sib)) { field = sib; break; }
+                    }
+                }
+                if (field && !asteriskLabels.has(field)) asteriskLabels.set(field, text);
+            });
+            
+            function labelText(el) {
+                if (asteriskLabels.has(el)) return asteriskLabels.get(el);
+                if (el.id) {
+                    var label = document.querySelector("label[for='" + CSS.escape(el.id) + "']");
+                    if (label && label.innerText.trim()) return label.innerText.trim();
+                }
+                if (el.labels && el.labels.length && el.labels[0].innerText.trim()) {
+                    return el.labels[0].innerText.trim();
+                }
+                var aria = (el.getAttribute('aria-label') || '').trim();
+                if (aria) return aria;
+                var prev = el.previousElementSibling;
+                if (prev && prev.tagName.toLowerCase() === 'label') return (prev.innerText || '').trim();
+                return '';
+            }
+            
+            var results = [];
+            document.querySelectorAll('input, select, textarea').forEach(function(el) {
+                if (!isVisible(el)) return;
+                var className = typeof el.className === 'string' ? el.className : '';
+                results.push({
+                    el: el,
+                    tag: el.tagName.toLowerCase(),
+                    type: (el.type || '').toLowerCase(),
+                    id: el.id || '',
+                    name: el.name || '',
+                    className: className,
+                    role: el.getAttribute('role') || '',
+                    ariaLabel: el.getAttribute('aria-label') || '',
+                    placeholder: el.getAttribute('placeholder') || '',
+                    required: !!(el.required || el.getAttribute('aria-required') === 'true' || /required/.test(className)),
+                    hasAsterisk: asteriskLabels.has(el),
+                    empty: isEmpty(el),
+                    label: labelText(el),
+                    parentText: el.parentElement ? (el.parentElement.innerText || '').trim().slice(0, 100) : '',
+                    inModal: inModal(el)
+                });
+            });
+            return results;
+        """) or []
+
+    @staticmethod
+    def _form_field_type(info):
+        """Map scanned field metadata to the field type names used by the form handlers"""
+        if info['tag'] == 'select':
+            return 'dropdown'
+        if info['tag'] == 'textarea':
+            return 'textarea'
+        return {
+            'radio': 'radio', 'checkbox': 'checkbox', 'number': 'number',
+            'text': 'text', 'email': 'email', 'tel': 'phone'
+        }.get(info['type'])
 
     def find_required_empty_fields(self):
         """Find required fields that are empty"""
         required_fields = []
         
-        # Enhanced required field detection for LinkedIn forms
-        required_selectors = [
-            "input[required]",
-            "textarea[required]",
-            "select[required]",
-            "input[aria-required='true']",
-            "textarea[aria-required='true']", 
-            "select[aria-required='true']",
-            "input[class*='required']",
-            "textarea[class*='required']",
-            "select[class*='required']"
-        ]
-        
-        for selector in required_selectors:
-            try:
-                fields = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for field in fields:
-                    if field.is_displayed():
-                        # Check if field is empty
-                        current_value = field.get_attribute('value') or ""
-                        tag_name = field.tag_name.lower()
-                        
-                        is_empty = False
-                        if tag_name == "select":
-                            # For select elements, check if default option is selected
-                            selected_text = field.find_element(By.CSS_SELECTOR, "option:checked").text.strip()
-                            is_empty = not selected_text or selected_text in ["Select", "Choose", "Please select", ""]
-                        elif tag_name in ["input", "textarea"]:
-                            is_empty = not current_value.strip()
-                        
-                        if is_empty:
-                            label = self.get_field_label(field)
-                            if label:
-                                required_fields.append((field, label))
-                                print(f"🔍 Found required empty field: {label[:50]}...")
-            except Exception as e:
-                print(f"⚠️ Error checking required field: {e}")
-                continue
-        
-        # Also look for fields with asterisk (*) indicators near labels
         try:
-            asterisk_labels = self.driver.find_elements(By.XPATH, "//label[contains(text(), '*')]")
-            for label_elem in asterisk_labels:
-                if label_elem.is_displayed():
-                    # Find associated input field
-                    for_attr = label_elem.get_attribute('for')
-                    if for_attr:
-                        try:
-                            field = self.driver.find_element(By.ID, for_attr)
-                            if field.is_displayed():
-                                current_value = field.get_attribute('value') or ""
-                                if not current_value.strip():
-                                    label_text = label_elem.text.strip()
-                                    if (field, label_text) not in required_fields:
-                                        required_fields.append((field, label_text))
-                                        print(f"🔍 Found asterisk-marked required field: {label_text[:50]}...")
-                        except:
-                            continue
-        except:
-            pass
+            for info in self._scan_form_fields_js():
+                if not (info['required'] or info['hasAsterisk']) or not info['empty']:
+                    continue
+                field = info['el']
+                # Fall back to the full label lookup only when the browser found nothing
+                label = info['label'] or self.get_field_label(field)
+                if label:
+                    required_fields.append((field, label))
+                    print(f"🔍 Found required empty field: {label[:50]}...")
+        except Exception as e:
+            print(f"⚠️ Error checking required fields: {e}")
                 
         print(f"🔍 Total required empty fields found: {len(required_fields)}")
         return required_fields
 
+    # Question-like labels detected by detect_form_questions, as one XPath union
+    _QUESTION_XPATH = (
+        "//label[contains(text(), '?') or contains(text(), 'authorized') or contains(text(), 'eligible')"
+        " or contains(text(), 'visa') or contains(text(), 'sponsorship') or contains(text(), 'Bachelor')"
+        " or contains(text(), 'degree') or contains(text(), 'commut') or contains(text(), 'experience')"
+        " or contains(text(), 'years')]"
+        " | //fieldset/legend[contains(text(), '?')]"
+    )
+
     def detect_form_questions(self):
         """Detect if there are actual form questions that need to be answered"""
         actual_questions = []
+        seen = set()
         
         try:
             # Look for actual form questions - labels that are associated with input fields
-            # and contain question-like text
-            question_patterns = [
-                "//label[contains(text(), '?')]",  # Questions with question marks
-                "//label[contains(text(), 'authorized')]",
-                "//label[contains(text(), 'eligible')]", 
-                "//label[contains(text(), 'visa')]",
-                "//label[contains(text(), 'sponsorship')]",
-                "//label[contains(text(), 'Bachelor')]",
-                "//label[contains(text(), 'degree')]",
-                "//label[contains(text(), 'commut')]",
-                "//label[contains(text(), 'experience')]",
-                "//label[contains(text(), 'years')]",
-                "//fieldset/legend[contains(text(), '?')]",
-                "//div[contains(@class, 'form-element')]//label[contains(text(), '?')]"
-            ]
-            
-            # Skip these non-question elements
-            skip_keywords = [
-                'upload', 'resume', 'cover letter', 'search', 'alert', 'deselect', 
-                'select resume', 'set alert', 'choose file', 'browse'
-            ]
-            
-            for pattern in question_patterns:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            text = elem.text.strip()
-                            # Only include if it's a real question and not in skip list
-                            if (text and len(text) > 10 and 
-                                not any(skip in text.lower() for skip in skip_keywords)):
-                                
-                                # Check if this label is associated with a form input
-                                label_for = elem.get_attribute('for')
-                                if label_for:
-                                    try:
-                                        associated_input = self.driver.find_element(By.ID, label_for)
-                                        if associated_input.is_displayed():
-                                            actual_questions.append(text[:100])
-                                    except:
-                                        pass
-                                else:
-                                    # Look for nearby form inputs
-                                    try:
-                                        parent = elem.find_element(By.XPATH, "./..")
-                                        inputs = parent.find_elements(By.CSS_SELECTOR, "input, select, textarea")
-                                        if any(inp.is_displayed() for inp in inputs):
-                                            actual_questions.append(text[:100])
-                                    except:
-                                        pass
-                except:
-                    continue
+            # and contain question-like text, all matched in a single XPath union. Visibility and
+            # the associated input (by for= id, else a visible input next to the label) are
+            # resolved in the browser, so the whole scan is one round trip
+            candidates = self.driver.execute_script("""
+                var visible = function(e) { return !!e && e.offsetParent !== null; };
+                var hits = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var found = [];
+                for (var i = 0; i < hits.snapshotLength; i++) {
+                    var label = hits.snapshotItem(i);
+                    if (!visible(label)) continue;
+                    var forId = label.getAttribute('for'), hasInput;
+                    if (forId) {
+                        hasInput = visible(document.getElementById(forId));
+                    } else {
+                        hasInput = Array.from(label.parentNode.querySelectorAll('input, select, textarea')).some(visible);
+                    }
+                    found.push([(label.innerText || '').trim(), hasInput]);
+                }
+                return found;
+            """, self._QUESTION_XPATH) or []
+            
+            for text, has_input in candidates:
+                question = text[:100]
+                # Only include if it's a new, real question and not in skip list
+                if (has_input and text and len(text) > 10 and question not in seen and
+                        not _SKIP_QUESTION_RE.search(text.lower())):
+                    seen.add(question)
+                    actual_questions.append(question)
                     
         except Exception as e:
             print(f"⚠️ Error detecting questions: {e}")
         
-        # Remove duplicates
-        actual_questions = list(set(actual_questions))
-        
         if actual_questions:
             print(f"🔍 Detected {len(actual_questions)} actual form questions:")
             for i, q in enumerate(actual_questions[:5]):  # Show first 5
@@ -1755,81 +2194,79 @@ class StealthLinkedin:
         """Find fields with asterisk (*) - these are definitely required"""
         required_fields = []
         
-        # Find all labels with asterisk
-        labels_with_asterisk = self.driver.find_elements(By.XPATH, "//label[contains(text(), '*')]")
-        
-        for label_elem in labels_with_asterisk:
-            try:
-                if not label_elem.is_displayed():
-                    continue
-                    
-                label_text = label_elem.text.strip()
-                print(f"🌟 Found required field label: {label_text}")
-                
-                # Find the associated form field
-                field_element = None
-                
-                # Method 1: Use 'for' attribute
-                for_attr = label_elem.get_attribute('for')
-                if for_attr:
-                    try:
-                        field_element = self.driver.find_element(By.ID, for_attr)
-                    except:
-                        pass
-                
-                # Method 2: Look for input/select/textarea in same container
-                if not field_element:
-                    try:
-                        parent = label_elem.find_element(By.XPATH, "./..")
-                        field_candidates = parent.find_elements(By.CSS_SELECTOR, "input, select, textarea")
-                        for candidate in field_candidates:
-                            if candidate.is_displayed():
-                                field_element = candidate
-                                break
-                    except:
-                        pass
-                
-                # Method 3: Look for following siblings
-                if not field_element:
-                    try:
-                        siblings = label_elem.find_elements(By.XPATH, "./following-sibling::*")
-                        for sibling in siblings:
-                            if sibling.tag_name.lower() in ['input', 'select', 'textarea'] and sibling.is_displayed():
-                                field_element = sibling
-                                break
-                    except:
-                        pass
-                
-                if field_element:
-                    required_fields.append((field_element, label_text))
-                    print(f"  ✅ Found associated {field_element.tag_name} element")
-                else:
-                    print(f"  ❌ Could not find form element for: {label_text}")
-                    
-            except Exception as e:
-                print(f"⚠️ Error processing asterisk label: {e}")
-                continue
+        try:
+            for info in self._scan_form_fields_js():
+                if info['hasAsterisk']:
+                    required_fields.append((info['el'], info['label']))
+                    print(f"🌟 Found required field label: {info['label']}")
+                    print(f"  ✅ Found associated {info['tag']} element")
+        except Exception as e:
+            print(f"⚠️ Error processing asterisk labels: {e}")
         
         return required_fields
 
+    # Browser-side snapshot of one field, shared by _read_field_states and _query_field_states
+    _FIELD_STATE_JS = """
+        function fieldState(e) {
+            var tag = e.tagName.toLowerCase();
+            var selected = tag === 'select' ? e.selectedOptions[0] : null;
+            var empty = tag === 'select'
+                ? (!selected || /^(select|choose|please select|--|)$/i.test(selected.text.trim()))
+                : !(e.value || '').trim();
+            var groupChecked = false;
+            if (e.type === 'radio' && e.name) {
+                groupChecked = Array.from(document.querySelectorAll("input[type='radio'][name='" + CSS.escape(e.name) + "']"))
+                    .some(function(r) { return r.checked; });
+            }
+            return {
+                el: e,
+                tag: tag,
+                type: (e.type || '').toLowerCase(),
+                id: e.id || '',
+                name: e.name || '',
+                className: (typeof e.className === 'string') ? e.className : '',
+                placeholder: e.getAttribute('placeholder') || '',
+                ariaLabel: e.getAttribute('aria-label') || '',
+                value: e.value || '',
+                checked: !!e.checked,
+                selectedText: selected ? selected.text.trim() : '',
+                empty: empty,
+                groupChecked: groupChecked
+            };
+        }
+    """
+
+    def _read_field_states(self, fields):
+        """Read tag, type, attributes, value, emptiness and checked state of many fields (and their radio groups) in one call"""
+        return self.driver.execute_script(
+            self._FIELD_STATE_JS + "return arguments[0].map(fieldState);", list(fields)) or []
+
+    def _query_field_states(self, css):
+        """Find the visible fields matching a CSS selector and read their state, all in one call"""
+        return self._run_scoped(
+            self._FIELD_STATE_JS +
+            "return Array.from((arguments[1] || document).querySelectorAll(arguments[0]))"
+            ".filter(function(e) { return e.offsetParent !== null; }).map(fieldState);", css) or []
+
+    def _read_field_state(self, field):
+        """Read the state of a single field, see _read_field_states"""
+        return self._read_field_states([field])[0]
+
     def is_field_already_filled(self, field):
         """Check if a field already has meaningful content"""
         try:
-            if field.tag_name == 'select':
-                select = Select(field)
-                current = select.first_selected_option.text.strip()
-                return current and current.lower() not in ['select', 'choose', 'please select', '', '--', 'none']
-            elif field.get_attribute('type') == 'checkbox':
-                return field.is_selected()
-            elif field.get_attribute('type') == 'radio':
-                name = field.get_attribute('name')
-                if name:
-                    radios = self.driver.find_elements(By.CSS_SELECTOR, f"input[type='radio'][name='{name}']")
-                    return any(radio.is_selected() for radio in radios)
-                return field.is_selected()
+            info = self._read_field_state(field)
+            if info['tag'] == 'select':
+                current = info['selectedText']
+                return bool(current) and current.lower() not in ['select', 'choose', 'please select', '', '--', 'none']
+            elif info['type'] == 'checkbox':
+                return info['checked']
+            elif info['type'] == 'radio':
+                if info['name']:
+                    return info['groupChecked']
+                return info['checked']
             else:
-                value = field.get_attribute('value') or ''
-                return len(value.strip()) > 0
+                return len(info['value'].strip()) > 0
         except:
             return False
 
@@ -1837,202 +2274,140 @@ class StealthLinkedin:
         """Find relevant form fields that need to be filled (skip search, upload, etc.)"""
         relevant_fields = []
         
-        # Skip fields that are not part of the application form
-        skip_field_keywords = [
-            'search', 'upload', 'browse', 'choose file', 'resume', 'cover letter',
-            'alert', 'notification', 'email alert', 'job alert', 'deselect', 'select resume',
-            'find', 'location search', 'company search', 'search-global-typeahead'
-        ]
+        try:
+            scanned = self._scan_form_fields_js()
+        except Exception as e:
+            print(f"⚠️ Error scanning form fields: {e}")
+            return relevant_fields
         
-        # Prioritize field types - more important ones first
-        field_selectors = [
-            ("input[type='radio']", "radio"),           # Yes/No questions
-            ("input[type='checkbox']", "checkbox"),     # Agreement checkboxes  
-            ("select", "dropdown"),                     # Dropdowns
-            ("input[type='number']", "number"),         # Numeric inputs
-            ("textarea", "textarea"),                   # Text areas
-            ("input[type='text']", "text"),            # Text inputs (but filtered)
-            ("input[type='email']", "email"),          # Email inputs
-            ("input[type='tel']", "phone")             # Phone inputs
-        ]
+        # Keep the original priority order: radios and checkboxes first, free text last
+        typed_fields = [(info, self._form_field_type(info)) for info in scanned]
+        typed_fields = [(info, field_type) for info, field_type in typed_fields if field_type]
+        typed_fields.sort(key=lambda item: self._FIELD_TYPE_ORDER.index(item[1]))
         
-        for selector, field_type in field_selectors:
-            try:
-                fields = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for field in fields:
-                    if not field.is_displayed():
-                        continue
-                        
-                    # Get field context
-                    label = self.get_field_label(field)
-                    field_id = field.get_attribute('id') or ''
-                    field_name = field.get_attribute('name') or ''
-                    field_class = field.get_attribute('class') or ''
-                    
-                    # Skip search fields by ID/class/name patterns
-                    search_patterns = [
-                        'search', 'typeahead', 'autocomplete', 'find', 'lookup', 
-                        'jobs-search', 'search-box', 'query', 'keyword', 'filter',
-                        'jobs-location', 'location-search', 'company-search',
-                        'single-typeahead', 'search-typeahead', 'combobox-input',
-                        'search-global-typeahead', 'global-nav', 'nav-search'
-                    ]
-                    field_attributes = (field_id + field_name + field_class).lower()
-                    if any(pattern in field_attributes for pattern in search_patterns):
-                        print(f"⏭️ Skipping search field: {field_id or field_name or field_class}")
-                        continue
-                    
-                    # Also skip by role and aria attributes
-                    role = field.get_attribute('role') or ''
-                    aria_label = field.get_attribute('aria-label') or ''
-                    placeholder = field.get_attribute('placeholder') or ''
-                    
-                    # Skip LinkedIn header search and navigation elements
-                    if ('combobox' in role.lower() or 
-                        'search' in (aria_label + role + placeholder).lower() or
-                        placeholder.lower() == 'search'):
-                        print(f"⏭️ Skipping search field by role/aria/placeholder: {role or aria_label or placeholder}")
-                        continue
-                    
-                    # Skip fields that are outside the application modal
-                    try:
-                        # Check if field is inside the easy-apply modal
-                        modal_ancestor = field.find_element(By.XPATH, "./ancestor::*[contains(@data-test-modal-id, 'easy-apply') or contains(@class, 'jobs-easy-apply')]")
-                        # If we found a modal ancestor, this field is part of the application form
-                    except:
-                        # If no modal ancestor found, this field is probably not part of the application
-                        if field_type == 'text' and 'search' in (aria_label + placeholder).lower():
-                            print(f"⏭️ Skipping field outside application modal: {aria_label or placeholder}")
-                            continue
-                    
-                    # Skip if label contains skip keywords
-                    if label:
-                        label_lower = label.lower()
-                        if any(skip in label_lower for skip in skip_field_keywords):
-                            print(f"⏭️ Skipping irrelevant field: {label[:30]}...")
-                            continue
-                        
-                        # Include if it's a form question or checkbox/radio (these are usually required)
-                        should_include = False
-                        
-                        if field_type in ['radio', 'checkbox']:
-                            # Always include radio buttons and checkboxes
-                            should_include = True
-                        elif field_type == 'dropdown':
-                            # Include dropdowns that aren't location searches
-                            should_include = True
-                        elif len(label) > 5 and ('?' in label or 
-                             any(word in label_lower for word in [
-                                 'experience', 'years', 'authorized', 'eligible', 'visa', 
-                                 'sponsorship', 'degree', 'bachelor', 'commut', 'willing',
-                                 'available', 'salary', 'notice', 'start', 'agree', 'terms',
-                                 'onsite', 'remote', 'work', 'location', 'city', 'country'
-                             ])):
-                            should_include = True
-                            
-                            relevant_fields.append((field, label, field_type))
-                        if should_include:
-                            print(f"🔍 Found {field_type} field: {label[:50]}...")
-                    
-                    # Special case: unlabeled checkboxes and radio buttons (still include them)
-                    elif field_type in ['radio', 'checkbox']:
-                        # Try to get context from nearby text
-                        try:
-                            parent = field.find_element(By.XPATH, "./..")
-                            context_text = parent.text.strip()[:100]
-                            if context_text and len(context_text) > 5:
-                                relevant_fields.append((field, context_text, field_type))
-                                print(f"🔍 Found unlabeled {field_type}: {context_text[:50]}...")
-                        except:
-                            relevant_fields.append((field, f"Unlabeled {field_type}", field_type))
-                            print(f"🔍 Found unlabeled {field_type} field")
-                            
-            except Exception as e:
-                print(f"⚠️ Error finding {field_type} fields: {e}")
+        for info, field_type in typed_fields:
+            field = info['el']
+            field_id = info['id']
+            field_name = info['name']
+            field_class = info['className']
+            
+            # Skip search fields by ID/class/name patterns
+            field_attributes = (field_id + field_name + field_class).lower()
+            if _SEARCH_FIELD_RE.search(field_attributes):
+                print(f"⏭️ Skipping search field: {field_id or field_name or field_class}")
                 continue
-        
-        return relevant_fields
-
-    def handle_application_form(self, job_context=""):
-        """Simple form handler: Click Next until errors, then AI fills fields"""
-        try:
-            print("🚀 SIMPLE FLOW: Trying to click Next first...")
             
-            # Step 1: Try to click Next/Continue immediately
-            if self.try_next_step_without_filling():
-                print("✅ Clicked Next successfully - no form filling needed!")
-                return True
+            # Also skip by role and aria attributes
+            role = info['role']
+            aria_label = info['ariaLabel']
+            placeholder = info['placeholder']
             
-            # Step 2: If Next failed, check for form errors
-            print("⚠️ Next button failed - checking for form errors...")
-            errors = self.get_form_errors()
+            # Skip LinkedIn header search and navigation elements
+            if ('combobox' in role.lower() or 
+                'search' in (aria_label + role + placeholder).lower() or
+                placeholder.lower() == 'search'):
+                print(f"⏭️ Skipping search field by role/aria/placeholder: {role or aria_label or placeholder}")
+                continue
             
-            if errors:
-                print(f"🔍 Found {len(errors)} form errors - AI will fill only error fields")
-                
-                # Check for validation errors first - these are priority
-                errors = self.get_form_errors()
-                if errors:
-                    print(f"� Found validation errors: {len(errors)} errors detected")
-                    print("�🚫 NOT trying to skip - will fill error fields first")
-                    
-                    # Find and fill fields with errors first
-                    error_fields = self.find_fields_with_errors()
-                    filled_count = 0
-                    
-                    for field, label in error_fields:
-                        if self.fill_form_field(field, label, job_context, force_fill=True):
-                            filled_count += 1
-                            self.human_like_delay(1, 2)
-                    
-                    print(f"🤖 Filled {filled_count} error fields")
-                    
-                    # Try to proceed after filling error fields
-                    if filled_count > 0:
-                        if self.try_next_step_without_filling():
-                            return True
-                else:
-                    print("🚫 NOT trying to skip - will fill form fields first")
-                    
-                    # No validation errors, but we have form fields to fill
-                    filled_count = 0
-                    
-                    # Try to fill all relevant form fields
-                    # Use simple handler instead of complex logic
-                    return self.simple_form_handler(job_context)
+            # Skip fields that are outside the application modal
+            if not info['inModal'] and field_type == 'text' and 'search' in (aria_label + placeholder).lower():
+                print(f"⏭️ Skipping field outside application modal: {aria_label or placeholder}")
+                continue
             
-        except Exception as e:
-            print(f"❌ Error handling form: {e}")
+            label = info['label'] or self.get_field_label(field)
+            
+            # Skip if label contains skip keywords
+            if label:
+                label_lower = label.lower()
+                if _SKIP_FIELD_RE.search(label_lower):
+                    print(f"⏭️ Skipping irrelevant field: {label[:30]}...")
+                    continue
+                
+                # Include if it's a form question or checkbox/radio (these are usually required)
+                should_include = False
+                
+                if field_type in ['radio', 'checkbox']:
+                    # Always include radio buttons and checkboxes
+                    should_include = True
+                elif field_type == 'dropdown':
+                    # Include dropdowns that aren't location searches
+                    should_include = True
+                elif len(label) > 5 and '?' in label:
+                    # Screening questions - the common case, no keyword scan needed
+                    should_include = True
+                    
+                    relevant_fields.append((field, label, field_type))
+                elif len(label) > 5 and _INCLUDE_LABEL_RE.search(label_lower):
+                    should_include = True
+                    
+                    relevant_fields.append((field, label, field_type))
+                if should_include:
+                    print(f"🔍 Found {field_type} field: {label[:50]}...")
+            
+            # Special case: unlabeled checkboxes and radio buttons (still include them)
+            elif field_type in ['radio', 'checkbox']:
+                # Use context from nearby text
+                context_text = info['parentText']
+                if context_text and len(context_text) > 5:
+                    relevant_fields.append((field, context_text, field_type))
+                    print(f"🔍 Found unlabeled {field_type}: {context_text[:50]}...")
+        
+        return relevant_fields
+
+    def _has_empty_required_fields(self):
+        """Cheap check for visibly empty required fields, where clicking Next can only fail"""
+        try:
+            return bool(self.driver.execute_script("""
+                var root = document.querySelector('.jobs-easy-apply-content') || document;
+                if (root.querySelector('select:invalid')) return true;
+                return Array.from(root.querySelectorAll("[required], [aria-required='true']")).some(function(e) {
+                    return e.offsetParent !== null && ['input', 'select', 'textarea'].indexOf(e.tagName.toLowerCase()) !== -1 &&
+                        e.type !== 'radio' && e.type !== 'checkbox' && !(e.value || '').trim();
+                });
+            """))
+        except:
             return False
 
-    def simple_form_handler(self, job_context=""):
-        """Clean simple form handler: Click Next until errors, then AI fills fields"""
+    def simple_form_handler(self, job_context="", errors=None):
+        """Clean simple form handler: Click Next until errors, then AI fills fields.
+        
+        Pass the errors read after a failed Next click (or [] when required fields are known
+        to be empty) to skip straight to filling."""
         try:
-            print("🚀 SIMPLE FLOW: Trying to click Next first...")
-            
-            # Step 1: Try to click Next/Continue immediately
-            if self.try_next_step_without_filling():
-                print("✅ Clicked Next successfully - no form filling needed!")
-                return True
-            
-            # Step 2: If Next failed, check for form errors
-            print("⚠️ Next button failed - checking for form errors...")
-            errors = self.get_form_errors()
+            if errors is None:
+                # One full-form scan per step decides whether the optimistic Next click can work
+                if self._has_empty_required_fields():
+                    # Skip the optimistic click - validation would certainly fail
+                    print("📝 Required fields are empty - skipping the optimistic Next click")
+                    errors = []
+                else:
+                    print("🚀 SIMPLE FLOW: Trying to click Next first...")
+                    
+                    # Step 1: Try to click Next/Continue immediately
+                    if self.try_next_step_without_filling():
+                        print("✅ Clicked Next successfully - no form filling needed!")
+                        return True
+                    
+                    # Step 2: If Next failed, check for form errors
+                    print("⚠️ Next button failed - checking for form errors...")
+                    errors = self.get_form_errors()
             
             if errors:
                 print(f"🔍 Found {len(errors)} form errors - AI will fill only error fields")
                 
                 # Find and fill only the fields with errors
-                error_fields = self.find_fields_with_errors()
+                error_fields = self.find_fields_with_errors(errors)
                 filled_count = 0
                 
                 for field, label in error_fields:  # Fill ALL error fields
                     print(f"🤖 Filling error field: {label}")
                     if self.simple_fill_field(field, label):
                         filled_count += 1
-                        self.human_like_delay(0.5, 1)  # Faster delays
                     # Don't try Next after each field - fill all first!
                 
+                # One settle for the whole batch instead of a delay after every field
+                if filled_count:
+                    self.human_like_delay(1, 2)
                 print(f"📝 Filled {filled_count} error fields, trying Next again...")
                 return self.try_next_step_without_filling()
             
@@ -2048,9 +2423,10 @@ class StealthLinkedin:
                     print(f"🤖 Filling required field: {label}")
                     if self.simple_fill_field(field, label):
                         filled_count += 1
-                        self.human_like_delay(0.5, 1)
                     # Don't try Next after each field - fill all first!
                 
+                if filled_count:
+                    self.human_like_delay(1, 2)
                 print(f"📝 Filled {filled_count} required fields, trying Next again...")
                 return self.try_next_step_without_filling()
             
@@ -2087,19 +2463,25 @@ class StealthLinkedin:
             ]
             
             suggestion_found = False
-            for selector in suggestion_selectors:
-                try:
-                    suggestion = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if suggestion.is_displayed():
-                        suggestion.click()
-                        print(f"✅ Selected first location suggestion: {selector}")
-                        suggestion_found = True
-                        break
-                except:
-                    continue
-            
-            if not suggestion_found:
-                # Try using arrow down + enter method
+            try:
+                # Probe every selector in one script call and return the first visible suggestion
+                match = self.driver.execute_script("""
+                    for (var i = 0; i < arguments[0].length; i++) {
+                        var el = document.querySelector(arguments[0][i]);
+                        if (el && el.offsetParent !== null) return [arguments[0][i], el];
+                    }
+                    return null;
+                """, suggestion_selectors)
+                if match:
+                    selector, suggestion = match
+                    suggestion.click()
+                    print(f"✅ Selected first location suggestion: {selector}")
+                    suggestion_found = True
+            except:
+                pass
+            
+            if not suggestion_found:
+                # Try using arrow down + enter method
                 try:
                     field.send_keys(Keys.ARROW_DOWN)
                     self.human_like_delay(0.5, 1)
@@ -2125,50 +2507,53 @@ class StealthLinkedin:
 
     def get_field_error_message(self, field):
         """Get specific error message for a field"""
+        # Look for error messages near the field
+        error_selectors = [
+            ".artdeco-inline-feedback--error",
+            ".form-element-validation-error",
+            "[role='alert']",
+            ".error-message"
+        ]
+        
         try:
-            # Check for aria-describedby error
-            aria_describedby = field.get_attribute('aria-describedby')
-            if aria_describedby:
-                try:
-                    error_elem = self.driver.find_element(By.ID, aria_describedby)
-                    if error_elem.is_displayed():
-                        return error_elem.text.strip()
-                except:
-                    pass
-            
-            # Look for error messages near the field
-            error_selectors = [
-                ".artdeco-inline-feedback--error",
-                ".form-element-validation-error",
-                "[role='alert']",
-                ".error-message"
-            ]
-            
-            # Check parent containers for error messages
-            try:
-                parent = field.find_element(By.XPATH, "./..")
-                for selector in error_selectors:
-                    try:
-                        error_elem = parent.find_element(By.CSS_SELECTOR, selector)
-                        if error_elem.is_displayed():
-                            return error_elem.text.strip()
-                    except:
-                        continue
-            except:
-                pass
-            
-            return ""
+            # Check aria-describedby, then the parent container, in a single call
+            return self.driver.execute_script("""
+                var field = arguments[0];
+                function isVisible(el) { return el && el.offsetParent !== null; }
+                
+                var describedBy = field.getAttribute('aria-describedby');
+                var described = describedBy ? document.getElementById(describedBy) : null;
+                if (isVisible(described)) return (described.innerText || '').trim();
+                
+                var parent = field.parentElement;
+                if (!parent) return '';
+                for (var i = 0; i < arguments[1].length; i++) {
+                    var error = parent.querySelector(arguments[1][i]);
+                    if (isVisible(error)) return (error.innerText || '').trim();
+                }
+                return '';
+            """, field, error_selectors) or ""
         except:
             return ""
 
+    def _option_texts(self, select_elem):
+        """Return the trimmed text of every option of a select element in one call"""
+        return self.driver.execute_script(
+            "return Array.from(arguments[0].options).map(function(o) { return o.text.trim(); });", select_elem) or []
+
+    def _select_option_at(self, select_elem, index):
+        """Select the option at a known index, clicking it like Select does but without scanning every option"""
+        option = self.driver.execute_script("return arguments[0].options[arguments[1]];", select_elem, index)
+        if not option.is_selected():
+            option.click()
+
     def simple_fill_field(self, field, label):
         """Simple field filling using AI"""
         try:
             # Get options for dropdown/select fields
             options = []
             if field.tag_name == 'select':
-                select_options = field.find_elements(By.TAG_NAME, 'option')
-                options = [opt.text.strip() for opt in select_options if opt.text.strip()]
+                options = [text for text in self._option_texts(field) if text]
             
             # Check for specific error messages near this field
             error_message = self.get_field_error_message(field)
@@ -2180,83 +2565,75 @@ class StealthLinkedin:
                 # Handle dropdown with retry logic for stale elements
                 max_retries = 3
                 
+                # Tag the select so a stale reference can be relocated deterministically in one lookup
+                field_tag = f"app-{id(field)}"
+                try:
+                    self.driver.execute_script("arguments[0].setAttribute('data-app-tag', arguments[1]);", field, field_tag)
+                except:
+                    pass
+                
                 for retry in range(max_retries):
                     try:
                         # Re-find the select element to avoid stale element reference
                         if retry > 0:
-                            # Try to relocate the element by its attributes
-                            field_id = field.get_attribute('id')
-                            field_name = field.get_attribute('name')
-                            field_class = field.get_attribute('class')
-                            
-                            if field_id:
-                                field = self.driver.find_element(By.ID, field_id)
-                            elif field_name:
-                                field = self.driver.find_element(By.NAME, field_name)
-                            elif field_class:
-                                field = self.driver.find_element(By.CLASS_NAME, field_class.split()[0])
+                            field = self.driver.find_element(By.CSS_SELECTOR, f"[data-app-tag='{field_tag}']")
                         
-                        from selenium.webdriver.support.ui import Select
-                        select = Select(field)
+                        # Snapshot all option texts in one script call - every .text read is a WebDriver round-trip.
+                        # The option index is carried along so the winner is selected without a text search.
+                        opts_snapshot = [(index, text.lower(), text) for index, text in enumerate(self._option_texts(field))]
                         
-                        print(f"🔍 Dropdown options: {[opt.text.strip() for opt in select.options]}")
+                        print(f"🔍 Dropdown options: {[text for _, _, text in opts_snapshot]}")
                         print(f"🔍 AI answer: '{answer}'")
                         
                         # Skip placeholder options
-                        placeholder_options = ['select an option', 'select', 'choose', 'please select', '', '--', 'none']
-                        valid_options = [opt for opt in select.options if opt.text.strip().lower() not in placeholder_options]
+                        valid_options = [option for option in opts_snapshot if option[1] not in _PLACEHOLDER_OPTIONS]
+                        by_lower = {lower: (index, text) for index, lower, text in valid_options}
                         
-                        print(f"🔍 Valid options (excluding placeholders): {[opt.text.strip() for opt in valid_options]}")
+                        print(f"🔍 Valid options (excluding placeholders): {[text for _, _, text in valid_options]}")
                         
-                        # Try exact match first (only from valid options)
-                        for option in valid_options:
-                            option_text = option.text.strip()
-                            if option_text.lower() == answer.lower():
-                                select.select_by_visible_text(option_text)
-                                print(f"✅ Selected dropdown option (exact): {option_text}")
-                                return True
+                        answer_lower = answer.lower()
                         
-                        # Try partial match (only from valid options)
-                        for option in valid_options:
-                            option_text = option.text.strip()
-                            if answer.lower() in option_text.lower():
-                                select.select_by_visible_text(option_text)
-                                print(f"✅ Selected dropdown option (partial): {option_text}")
-                                return True
+                        # Try exact match first (only from valid options) - also covers plain Yes/No answers
+                        if answer_lower in by_lower:
+                            index, option_text = by_lower[answer_lower]
+                            self._select_option_at(field, index)
+                            print(f"✅ Selected dropdown option (exact): {option_text}")
+                            return True
                         
-                        # Try reverse partial match (only from valid options)
-                        for option in valid_options:
-                            option_text = option.text.strip()
-                            if option_text.lower() in answer.lower():
-                                select.select_by_visible_text(option_text)
-                                print(f"✅ Selected dropdown option (reverse partial): {option_text}")
-                                return True
+                        # Try partial, then reverse partial match in a single pass (only from valid options)
+                        partial_match = reverse_match = None
+                        for index, lower, option_text in valid_options:
+                            if partial_match is None and answer_lower in lower:
+                                partial_match = (index, option_text)
+                            if reverse_match is None and lower in answer_lower:
+                                reverse_match = (index, option_text)
                         
-                        # Try direct Yes/No matching for simple dropdowns
-                        if answer.lower() in ['yes', 'no']:
-                            for option in valid_options:
-                                option_text = option.text.strip().lower()
-                                if option_text == answer.lower():
-                                    select.select_by_visible_text(option.text.strip())
-                                    print(f"✅ Selected dropdown (Yes/No match): {option.text.strip()}")
-                                    return True
+                        if partial_match:
+                            self._select_option_at(field, partial_match[0])
+                            print(f"✅ Selected dropdown option (partial): {partial_match[1]}")
+                            return True
+                        
+                        if reverse_match:
+                            self._select_option_at(field, reverse_match[0])
+                            print(f"✅ Selected dropdown option (reverse partial): {reverse_match[1]}")
+                            return True
                         
                         # Smart fallback for common patterns (only from valid options)
-                        if answer.lower() == 'professional' and any('professional' in opt.text.lower() for opt in valid_options):
-                            for option in valid_options:
-                                if 'professional' in option.text.lower():
-                                    select.select_by_visible_text(option.text.strip())
-                                    print(f"✅ Selected dropdown (smart match): {option.text.strip()}")
-                                    return True
+                        if answer_lower == 'professional':
+                            smart_match = next(((index, text) for index, lower, text in valid_options if 'professional' in lower), None)
+                            if smart_match:
+                                self._select_option_at(field, smart_match[0])
+                                print(f"✅ Selected dropdown (smart match): {smart_match[1]}")
+                                return True
                         
                         # Final fallback: If we can't match, select the first valid option (not placeholder)
                         if valid_options:
-                            first_valid = valid_options[0]
-                            select.select_by_visible_text(first_valid.text.strip())
-                            print(f"⚠️ Fallback selection (first valid): {first_valid.text.strip()}")
+                            index, _, first_valid = valid_options[0]
+                            self._select_option_at(field, index)
+                            print(f"⚠️ Fallback selection (first valid): {first_valid}")
                             return True
                         
-                        print(f"❌ Could not find matching option for: '{answer}' in {[opt.text.strip() for opt in select.options]}")
+                        print(f"❌ Could not find matching option for: '{answer}' in {[text for _, _, text in opts_snapshot]}")
                         return False
                         
                     except Exception as e:
@@ -2300,186 +2677,173 @@ class StealthLinkedin:
             print(f"❌ Error filling field {label}: {e}")
             return False
 
-    def find_fields_with_errors(self):
-        """Find specific form fields that have validation errors"""
+    @staticmethod
+    def _fallback_field_rank(state):
+        """Sort key for the fallback scan, following _FALLBACK_FIELD_ORDER"""
+        kind = state['tag'] if state['tag'] in ('select', 'textarea') else state['type']
+        return _FALLBACK_FIELD_ORDER.index(kind) if kind in _FALLBACK_FIELD_ORDER else len(_FALLBACK_FIELD_ORDER)
+
+    def find_fields_with_errors(self, validation_errors=None):
+        """Find specific form fields that have validation errors (pass errors already read to skip re-reading them)"""
         error_fields = []
+        seen_ids = set()  # WebElement ids already in error_fields
+        seen_radio_names = set()
         
         try:
-            # Enhanced error field detection for LinkedIn forms
-            error_field_selectors = [
-                "input[aria-invalid='true']",
-                "textarea[aria-invalid='true']", 
-                "select[aria-invalid='true']",
-                ".artdeco-text-input--error input",
-                ".form-element--error input",
-                ".form-element--error textarea",
-                ".form-element--error select",
-                ".form-element--error input[type='radio']",
-                ".form-element--error input[type='checkbox']",
-                ".jobs-easy-apply-form-element--error input",
-                ".jobs-easy-apply-form-element--error textarea", 
-                ".jobs-easy-apply-form-element--error select",
-                ".jobs-easy-apply-form-element--error input[type='radio']",
-                ".jobs-easy-apply-form-element--error input[type='checkbox']",
-                "input[class*='error']",
-                "select[class*='error']",
-                "textarea[class*='error']",
-                "input[type='radio'][class*='error']",
-                "input[type='checkbox'][class*='error']"
-            ]
-            
-            for selector in error_field_selectors:
-                try:
-                    fields = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for field in fields:
-                        if field.is_displayed():
-                            label = self.get_field_label(field)
-                            if label:
-                                error_fields.append((field, label))
-                                print(f"🔍 Found error field: {label[:50]}...")
-                except:
-                    continue
+            # Enhanced error field detection for LinkedIn forms - one query for every error selector
+            try:
+                for field in self._visible_query(_ERROR_FIELD_SELECTOR):
+                    label = self.get_field_label(field)
+                    if label:
+                        seen_ids.add(field.id)
+                        error_fields.append((field, label))
+                        print(f"🔍 Found error field: {label[:50]}...")
+            except:
+                pass
             
             # If we detected validation errors but no error fields, find ALL form fields
             # This is a fallback when LinkedIn doesn't mark fields with error classes
-            validation_errors = self.get_form_errors()
+            if validation_errors is None:
+                validation_errors = self.get_form_errors()
+            # Stop scanning once there are enough fields to work on - the form re-renders after
+            # each fix and the rest get picked up by the next validation round anyway
+            enough = max(len(validation_errors), 3)
             if validation_errors and not error_fields:
                 print(f"🔍 No error fields found but have {len(validation_errors)} validation errors:")
                 for i, err in enumerate(validation_errors):
                     print(f"   Error {i+1}: {err[:100]}...")
                 print(f"🔍 Scanning all form fields...")
                 
-                # Find all visible form fields when we have validation errors
-                all_form_selectors = [
-                    "select",  # Dropdowns are most common with "Select an option"
-                    "input[type='text']",     # Text inputs (location, phone, etc.) - prioritize these
-                    "input[type='number']",   # Number inputs
-                    "input[type='tel']",      # Phone inputs
-                    "input[type='email']",    # Email inputs
-                    "textarea",               # Text areas
-                    "input[type='radio']",    # Radio buttons
-                    "input[type='checkbox']"  # Checkboxes
-                ]
-                
-                for field_selector in all_form_selectors:
-                    try:
-                        fields = self.driver.find_elements(By.CSS_SELECTOR, field_selector)
-                        for field in fields:
-                            if field.is_displayed():
-                                field_label = self.get_field_label(field)
+                # Find all visible form fields when we have validation errors, in one query
+                try:
+                    # Query, visibility filter and state read for every field in one round-trip
+                    states = self._query_field_states(_FALLBACK_FIELD_SELECTOR)
+                    for state in sorted(states, key=self._fallback_field_rank):
+                        if len(error_fields) >= enough:
+                            break
+                        field = state['el']
+                        field_label = self.get_field_label(field)
+                        
+                        # For dropdowns, check if they need selection
+                        if state['tag'] == 'select':
+                            try:
+                                # Selected text comes from the batched state read, option texts from one script call
+                                selected_text = state['selectedText']
+                                all_options = self._option_texts(field)
+                                print(f"   🔍 Dropdown check - Selected: '{selected_text}', Options: {all_options}")
                                 
-                                # For dropdowns, check if they need selection
-                                if field.tag_name == 'select':
-                                    try:
-                                        select = Select(field)
-                                        selected_text = select.first_selected_option.text.strip()
-                                        all_options = [opt.text.strip() for opt in select.options]
-                                        print(f"   🔍 Dropdown check - Selected: '{selected_text}', Options: {all_options}")
-                                        
-                                        # If no meaningful selection made
-                                        if not selected_text or selected_text.lower() in ['select', 'choose', 'please select', '', '--', 'select an option', 'none']:
-                                            if not field_label:
-                                                field_label = "Dropdown selection required"
-                                            error_fields.append((field, field_label))
-                                            print(f"🔍 Found unselected dropdown: {field_label[:50]}...")
-                                    except Exception as e:
-                                        print(f"   ⚠️ Error checking dropdown: {e}")
-                                        # Even if we can't check, add it if we have validation errors
+                                # If no meaningful selection made
+                                if not selected_text or selected_text.lower() in _PLACEHOLDER_OPTIONS:
+                                    if not field_label:
+                                        field_label = "Dropdown selection required"
+                                    seen_ids.add(field.id)
+                                    error_fields.append((field, field_label))
+                                    print(f"🔍 Found unselected dropdown: {field_label[:50]}...")
+                            except Exception as e:
+                                print(f"   ⚠️ Error checking dropdown: {e}")
+                                # Even if we can't check, add it if we have validation errors
+                                if not field_label:
+                                    field_label = "Dropdown field needs attention"
+                                seen_ids.add(field.id)
+                                error_fields.append((field, field_label))
+                                print(f"🔍 Added problematic dropdown: {field_label[:50]}...")
+                        
+                        # For radio buttons, check if any in group is selected
+                        elif state['type'] == 'radio':
+                            name = state['name']
+                            if name:
+                                try:
+                                    if not state['groupChecked']:
                                         if not field_label:
-                                            field_label = "Dropdown field needs attention"
-                                        error_fields.append((field, field_label))
-                                        print(f"🔍 Added problematic dropdown: {field_label[:50]}...")
+                                            field_label = "Radio button selection required"
+                                        # Only add once per radio group
+                                        if name not in seen_radio_names:
+                                            seen_radio_names.add(name)
+                                            seen_ids.add(field.id)
+                                            error_fields.append((field, field_label))
+                                            print(f"🔍 Found unselected radio group: {field_label[:50]}...")
+                                except:
+                                    pass
+                        
+                        # For checkboxes, check if they need to be checked
+                        elif state['type'] == 'checkbox':
+                            if not state['checked']:
+                                if not field_label:
+                                    field_label = "Checkbox agreement required"
+                                seen_ids.add(field.id)
+                                error_fields.append((field, field_label))
+                                print(f"🔍 Found unchecked checkbox: {field_label[:50]}...")
+                        
+                        # For other inputs, check if empty and looks required
+                        elif state['empty']:
+                            if field_label and len(field_label) > 5:
+                                # Check field attributes for search patterns
+                                field_id = state['id']
+                                field_name = state['name']
+                                field_class = state['className']
+                                field_placeholder = state['placeholder']
+                                field_aria_label = state['ariaLabel']
                                 
-                                # For radio buttons, check if any in group is selected
-                                elif field.get_attribute('type') == 'radio':
-                                    name = field.get_attribute('name')
-                                    if name:
-                                        try:
-                                            radio_group = self.driver.find_elements(By.CSS_SELECTOR, f"input[type='radio'][name='{name}']")
-                                            if not any(radio.is_selected() for radio in radio_group if radio.is_displayed()):
-                                                if not field_label:
-                                                    field_label = "Radio button selection required"
-                                                # Only add once per radio group
-                                                if not any(name in str(existing_field) for existing_field, _ in error_fields):
-                                                    error_fields.append((field, field_label))
-                                                    print(f"🔍 Found unselected radio group: {field_label[:50]}...")
-                                        except:
-                                            pass
+                                all_field_text = (field_id + field_name + field_class + field_placeholder + field_aria_label + field_label).lower()
                                 
-                                # For checkboxes, check if they need to be checked
-                                elif field.get_attribute('type') == 'checkbox':
-                                    if not field.is_selected():
-                                        if not field_label:
-                                            field_label = "Checkbox agreement required"
-                                        error_fields.append((field, field_label))
-                                        print(f"🔍 Found unchecked checkbox: {field_label[:50]}...")
+                                # Skip if it's clearly a search field
+                                if _SKIP_ERROR_LABEL_RE.search(all_field_text):
+                                    print(f"⏭️ Skipping search/nav field: {field_label[:30]}...")
+                                    continue
+                                    
+                                # Skip if it's the LinkedIn global search
+                                if 'search-global-typeahead' in all_field_text or 'global-nav' in all_field_text:
+                                    print(f"⏭️ Skipping LinkedIn global search field")
+                                    continue
                                 
-                                # For other inputs, check if empty and looks required
-                                elif not field.get_attribute('value') or not field.get_attribute('value').strip():
-                                    if field_label and len(field_label) > 5:
-                                        # Skip obvious search/navigation fields
-                                        skip_labels = [
-                                            'search', 'find', 'lookup', 'filter', 'keyword', 'query',
-                                            'location search', 'company search', 'job search', 'global search',
-                                            'search jobs', 'search companies', 'search people'
-                                        ]
-                                        
-                                        # Check field attributes for search patterns
-                                        field_id = field.get_attribute('id') or ''
-                                        field_name = field.get_attribute('name') or ''
-                                        field_class = field.get_attribute('class') or ''
-                                        field_placeholder = field.get_attribute('placeholder') or ''
-                                        field_aria_label = field.get_attribute('aria-label') or ''
-                                        
-                                        all_field_text = (field_id + field_name + field_class + field_placeholder + field_aria_label + field_label).lower()
-                                        
-                                        # Skip if it's clearly a search field
-                                        if any(skip_word in all_field_text for skip_word in skip_labels):
-                                            print(f"⏭️ Skipping search/nav field: {field_label[:30]}...")
-                                            continue
-                                            
-                                        # Skip if it's the LinkedIn global search
-                                        if 'search-global-typeahead' in all_field_text or 'global-nav' in all_field_text:
-                                            print(f"⏭️ Skipping LinkedIn global search field")
-                                            continue
-                                        
-                                        error_fields.append((field, field_label))
-                                        print(f"🔍 Found empty required field: {field_label[:50]}...")
-                    except Exception as e:
-                        print(f"⚠️ Error scanning {field_selector}: {e}")
-                        continue
-                
-                # Special case: If validation errors contain dropdown options, find matching dropdowns
+                                seen_ids.add(field.id)
+                                error_fields.append((field, field_label))
+                                print(f"🔍 Found empty required field: {field_label[:50]}...")
+                except Exception as e:
+                    print(f"⚠️ Error scanning form fields: {e}")
+            
+                # Special case: If validation errors contain dropdown options, find matching dropdowns.
+                # The visible selects and their option words are read once and shared across errors.
+                all_selects = None
+                option_tokens_by_select = {}
                 for error in validation_errors:
-                    if 'select an option' in error.lower() or any(keyword in error.lower() for keyword in ['professional', 'conversational', 'native', 'bilingual']):
+                    if len(error_fields) >= enough:
+                        break
+                    kind_match = _ERROR_KIND_RE.search(error.lower())
+                    error_kind = kind_match.lastgroup if kind_match else None
+                    if error_kind == 'dropdown':
                         print(f"🔍 Detected dropdown-specific error: {error[:100]}...")
+                        error_words = set(re.findall(r'\w{4,}', error.lower()))
                         # Try to find dropdowns with matching options
-                        all_selects = self.driver.find_elements(By.CSS_SELECTOR, "select")
+                        if all_selects is None:
+                            all_selects = self._visible_query("select")
                         for select_elem in all_selects:
-                            if select_elem.is_displayed():
-                                try:
-                                    select = Select(select_elem)
-                                    options = [opt.text.strip() for opt in select.options]
-                                    # Check if this dropdown has options mentioned in the error
-                                    error_words = error.lower().split()
-                                    option_matches = sum(1 for opt in options if any(word in opt.lower() for word in error_words if len(word) > 3))
-                                    
-                                    if option_matches >= 2:  # At least 2 option words match
-                                        field_label = self.get_field_label(select_elem) or "Dropdown with validation error"
-                                        if (select_elem, field_label) not in error_fields:
-                                            error_fields.append((select_elem, field_label))
-                                            print(f"🎯 Found matching dropdown for error: {field_label[:50]}...")
-                                except Exception as e:
-                                    print(f"   ⚠️ Error checking dropdown options: {e}")
-                                    continue
+                            try:
+                                option_tokens = option_tokens_by_select.get(select_elem.id)
+                                if option_tokens is None:
+                                    options = self._option_texts(select_elem)
+                                    option_tokens = {token for opt in options for token in re.findall(r'\w+', opt.lower())}
+                                    option_tokens_by_select[select_elem.id] = option_tokens
+                                # Check if this dropdown has options mentioned in the error - count shared words
+                                option_matches = len(error_words & option_tokens)
+                                
+                                if option_matches >= 2:  # At least 2 option words match
+                                    field_label = self.get_field_label(select_elem) or "Dropdown with validation error"
+                                    if select_elem.id not in seen_ids:
+                                        seen_ids.add(select_elem.id)
+                                        error_fields.append((select_elem, field_label))
+                                        print(f"🎯 Found matching dropdown for error: {field_label[:50]}...")
+                            except Exception as e:
+                                print(f"   ⚠️ Error checking dropdown options: {e}")
+                                continue
                     
                     # Special case: If validation errors mention checkboxes, find them
-                    elif any(keyword in error.lower() for keyword in ['checkbox', 'check this box', 'agree', 'terms', 'privacy policy']):
+                    elif error_kind == 'checkbox':
                         print(f"🔍 Detected checkbox-specific error: {error[:100]}...")
                         # Try to find checkboxes that need to be checked
-                        all_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+                        all_checkboxes = self._visible_query("input[type='checkbox']")
                         for checkbox in all_checkboxes:
-                            if checkbox.is_displayed() and not checkbox.is_selected():
+                            if not checkbox.is_selected():
                                 try:
                                     field_label = self.get_field_label(checkbox)
                                     if not field_label:
@@ -2490,14 +2854,15 @@ class StealthLinkedin:
                                             # Extract meaningful label from parent text
                                             lines = [line.strip() for line in parent_text.split('\n') if line.strip()]
                                             for line in lines:
-                                                if any(word in line.lower() for word in ['agree', 'terms', 'privacy', 'policy', 'checkbox']):
+                                                if _AGREEMENT_LINE_RE.search(line.lower()):
                                                     field_label = line[:50] + "..." if len(line) > 50 else line
                                                     break
                                     
                                     if not field_label:
                                         field_label = "Checkbox agreement required"
                                     
-                                    if (checkbox, field_label) not in error_fields:
+                                    if checkbox.id not in seen_ids:
+                                        seen_ids.add(checkbox.id)
                                         error_fields.append((checkbox, field_label))
                                         print(f"🎯 Found unchecked checkbox: {field_label[:50]}...")
                                 except Exception as e:
@@ -2506,129 +2871,122 @@ class StealthLinkedin:
                 
                 # Additional comprehensive checkbox search for agreement checkboxes
                 # This is specifically for cases like "Select checkbox to proceed"
-                if any('checkbox' in error.lower() for error in validation_errors):
+                if len(error_fields) < enough and any('checkbox' in error.lower() for error in validation_errors):
                     print(f"🔍 Performing comprehensive checkbox search...")
-                    comprehensive_checkbox_selectors = [
-                        "input[type='checkbox']",
-                        "input[type='checkbox']:not(:checked)",
-                        "[role='checkbox']",
-                        "input[type='checkbox'][required]",
-                        "input[type='checkbox'][aria-required='true']"
-                    ]
-                    
-                    for selector in comprehensive_checkbox_selectors:
-                        try:
-                            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for checkbox in checkboxes:
-                                if checkbox.is_displayed() and not checkbox.is_selected():
-                                    # Try multiple ways to get the label
-                                    field_label = self.get_field_label(checkbox)
-                                    
-                                    if not field_label:
-                                        # Try to find nearby text that looks like a label
-                                        try:
-                                            # Check if checkbox is inside a label
-                                            parent_label = checkbox.find_element(By.XPATH, "./ancestor::label[1]")
-                                            if parent_label and parent_label.text.strip():
-                                                field_label = parent_label.text.strip()[:100]
-                                        except:
-                                            pass
-                                    
-                                    if not field_label:
-                                        # Check for adjacent text/spans
-                                        try:
-                                            next_sibling = checkbox.find_element(By.XPATH, "./following-sibling::*[1]")
-                                            if next_sibling and next_sibling.text.strip():
-                                                field_label = next_sibling.text.strip()[:100]
-                                        except:
-                                            pass
-                                    
-                                    if not field_label:
-                                        # Look at parent container text
-                                        try:
-                                            parent = checkbox.find_element(By.XPATH, "./..")
-                                            parent_text = parent.text.strip()
-                                            if parent_text and len(parent_text) > 5:
-                                                field_label = parent_text[:100]
-                                        except:
-                                            pass
-                                    
-                                    if not field_label:
-                                        field_label = "Agreement checkbox (no label found)"
-                                    
-                                    # Avoid duplicates
-                                    if not any(checkbox == existing_field for existing_field, _ in error_fields):
-                                        error_fields.append((checkbox, field_label))
-                                        print(f"🎯 Found comprehensive checkbox: {field_label[:50]}...")
-                        except Exception as e:
-                            print(f"   ⚠️ Error in comprehensive checkbox search: {e}")
-                            continue
+                    # One query for the union of selectors - each checkbox comes back once
+                    try:
+                        checkboxes = self._visible_query(_AGREEMENT_CHECKBOX_SELECTOR)
+                        for checkbox in checkboxes:
+                            if not checkbox.is_selected():
+                                # Try multiple ways to get the label
+                                field_label = self.get_field_label(checkbox)
+                                
+                                if not field_label:
+                                    # Try to find nearby text that looks like a label
+                                    try:
+                                        # Check if checkbox is inside a label
+                                        parent_label = checkbox.find_element(By.XPATH, "./ancestor::label[1]")
+                                        if parent_label and parent_label.text.strip():
+                                            field_label = parent_label.text.strip()[:100]
+                                    except:
+                                        pass
+                                
+                                if not field_label:
+                                    # Check for adjacent text/spans
+                                    try:
+                                        next_sibling = checkbox.find_element(By.XPATH, "./following-sibling::*[1]")
+                                        if next_sibling and next_sibling.text.strip():
+                                            field_label = next_sibling.text.strip()[:100]
+                                    except:
+                                        pass
+                                
+                                if not field_label:
+                                    # Look at parent container text
+                                    try:
+                                        parent = checkbox.find_element(By.XPATH, "./..")
+                                        parent_text = parent.text.strip()
+                                        if parent_text and len(parent_text) > 5:
+                                            field_label = parent_text[:100]
+                                    except:
+                                        pass
+                                
+                                if not field_label:
+                                    field_label = "Agreement checkbox (no label found)"
+                                
+                                # Avoid duplicates
+                                if checkbox.id not in seen_ids:
+                                    seen_ids.add(checkbox.id)
+                                    error_fields.append((checkbox, field_label))
+                                    print(f"🎯 Found comprehensive checkbox: {field_label[:50]}...")
+                    except Exception as e:
+                        print(f"   ⚠️ Error in comprehensive checkbox search: {e}")
+            
+            if len(error_fields) >= enough:
+                print(f"🔍 Total error fields found: {len(error_fields)} (stopped early)")
+                return error_fields
             
             # Look for fields near error messages with more comprehensive selectors
             try:
-                error_message_selectors = [
-                    ".artdeco-inline-feedback--error",
-                    ".form-element-validation-error",
-                    "[role='alert']",
-                    ".jobs-easy-apply-form-element__error",
-                    "[class*='error'][class*='message']",
-                    "[class*='validation'][class*='error']"
-                ]
-                
-                for selector in error_message_selectors:
-                    error_messages = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                # One query for the union of selectors - each message comes back once, already
+                # filtered to visible, non-empty messages and paired with its text
+                error_messages = self.driver.execute_script("""
+                    return Array.from(document.querySelectorAll(arguments[0]))
+                        .filter(function(e) { return !!(e.offsetParent || e.getClientRects().length); })
+                        .map(function(e) { return [e, (e.innerText || '').trim()]; })
+                        .filter(function(pair) { return pair[1]; });
+                """, _ERROR_MESSAGE_SELECTOR) or []
+                
+                for error_msg, error_text in error_messages:
+                    if len(error_fields) >= enough:
+                        break
+                    print(f"🔍 Found error message: {error_text[:50]}...")
                     
-                    for error_msg in error_messages:
-                        if error_msg.is_displayed() and error_msg.text.strip():
-                            error_text = error_msg.text.strip()
-                            print(f"🔍 Found error message: {error_text[:50]}...")
-                            
-                            # Parse the error message to understand what field is required
-                            # LinkedIn often puts the full question in the error message
-                            question_in_error = error_text
-                            
-                            # Look for input fields in the same form element or nearby
-                            search_elements = []
-                            try:
-                                # Try to find the form element container
-                                form_element = error_msg.find_element(By.XPATH, "./ancestor::*[contains(@class, 'form-element') or contains(@class, 'jobs-easy-apply-form-element')][1]")
-                                search_elements.append(form_element)
-                            except:
-                                # Fallback to parent elements
-                                try:
-                                    search_elements.extend([
-                                        error_msg.find_element(By.XPATH, "./.."),
-                                        error_msg.find_element(By.XPATH, "./../..")
-                                    ])
-                                except:
-                                    pass
-                            
-                            for search_elem in search_elements:
-                                try:
-                                    # Look for all types of form inputs
-                                    nearby_fields = search_elem.find_elements(By.CSS_SELECTOR, 
-                                        "input[type='radio'], input[type='checkbox'], select, input[type='text'], input[type='number'], textarea")
-                                    
-                                    for field in nearby_fields:
-                                        if field.is_displayed():
-                                            # Use the error message text as the question if no label found
-                                            field_label = self.get_field_label(field)
-                                            if not field_label:
-                                                # Extract the main question from error text
-                                                lines = question_in_error.split('\n')
-                                                for line in lines:
-                                                    if '?' in line and len(line) > 10:
-                                                        field_label = line.strip()
-                                                        break
-                                                if not field_label:
-                                                    field_label = question_in_error[:100]
-                                            
-                                            if field_label and (field, field_label) not in error_fields:
-                                                error_fields.append((field, field_label))
-                                                print(f"🔍 Found field with validation error: {field_label[:50]}...")
-                                except:
-                                    continue
+                    # Parse the error message to understand what field is required
+                    # LinkedIn often puts the full question in the error message
+                    question_in_error = error_text
+                    
+                    # Look for input fields in the same form element or nearby
+                    nearby_fields = []
+                    try:
+                        # Find the form element container with closest(), falling back to the parent and
+                        # grandparent, and return its visible inputs - all in one call
+                        nearby_fields = self.driver.execute_script("""
+                            var parent = arguments[0].parentElement, selector = arguments[1];
+                            var container = parent && parent.closest("[class*='form-element']");
+                            var roots = container ? [container] : [parent, parent && parent.parentElement].filter(Boolean);
+                            var fields = [];
+                            roots.forEach(function(root) {
+                                root.querySelectorAll(selector).forEach(function(f) {
+                                    if (f.offsetParent !== null && fields.indexOf(f) === -1) fields.push(f);
+                                });
+                            });
+                            return fields;
+                        """, error_msg,
+                            "input[type='radio'], input[type='checkbox'], select, input[type='text'], input[type='number'], textarea") or []
+                    except:
+                        pass
+                    
+                    for field in nearby_fields:
+                        try:
+                            # Use the error message text as the question if no label found
+                            field_label = self.get_field_label(field)
+                            if not field_label:
+                                # Extract the main question from error text
+                                lines = question_in_error.split('\n')
+                                for line in lines:
+                                    if '?' in line and len(line) > 10:
+                                        field_label = line.strip()
+                                        break
+                                if not field_label:
+                                    field_label = question_in_error[:100]
                             
+                            if field_label and field.id not in seen_ids:
+                                seen_ids.add(field.id)
+                                error_fields.append((field, field_label))
+                                print(f"🔍 Found field with validation error: {field_label[:50]}...")
+                        except:
+                            continue
+                        
             except Exception as e:
                 print(f"⚠️ Error processing error messages: {e}")
                 
@@ -2639,96 +2997,94 @@ class StealthLinkedin:
         return error_fields
     
     def get_field_label(self, element):
-        """Get label text for form element with enhanced LinkedIn form support"""
+        """Get label text for form element, memoized per form step"""
+        key = element.id
+        if key not in self._label_cache:
+            self._label_cache[key] = self._get_field_label_impl(element)
+        return self._label_cache[key]
+
+    def _get_field_label_impl(self, element):
+        """Get label text for form element with enhanced LinkedIn form support.
+        
+        The whole lookup cascade runs in the browser in a single call."""
         try:
-            # Try to find associated label by ID
-            element_id = element.get_attribute('id')
-            if element_id:
-                try:
-                    label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{element_id}']")
-                    label_text = label.text.strip()
-                    if label_text:
-                        return label_text
-                except:
-                    pass
-            
-            # Try aria-label or aria-labelledby
-            aria_label = element.get_attribute('aria-label')
-            if aria_label:
-                return aria_label.strip()
-                
-            aria_labelledby = element.get_attribute('aria-labelledby')
-            if aria_labelledby:
-                try:
-                    label_elem = self.driver.find_element(By.ID, aria_labelledby)
-                    return label_elem.text.strip()
-                except:
-                    pass
-            
-            # Try parent and ancestor elements for labels
-            search_ancestors = [
-                "./ancestor::*[contains(@class, 'form-element')][1]",
-                "./ancestor::*[contains(@class, 'jobs-easy-apply-form-element')][1]", 
-                "./..",
-                "./../.."
-            ]
-            
-            for ancestor_xpath in search_ancestors:
-                try:
-                    ancestor = element.find_element(By.XPATH, ancestor_xpath)
-                    
-                    # Look for label elements
-                    label_selectors = [
-                        "label",
-                        ".label",
-                        ".form-label", 
-                        "[class*='label']",
-                        ".jobs-easy-apply-form-element__label",
-                        ".artdeco-text-input__label"
-                    ]
-                    
-                    for selector in label_selectors:
-                        try:
-                            label_elem = ancestor.find_element(By.CSS_SELECTOR, selector)
-                            label_text = label_elem.text.strip()
-                            if label_text and len(label_text) < 200:
-                                return label_text
-                        except:
-                            continue
-                            
-                except:
-                    continue
-            
-            # Try sibling elements
-            try:
-                siblings = element.find_elements(By.XPATH, 
-                    "./preceding-sibling::*[position()<=3] | ./following-sibling::*[position()<=3]")
-                for sibling in siblings:
-                    text = sibling.text.strip()
-                    if text and 5 < len(text) < 200 and not text.isdigit():
-                        return text
-            except:
-                pass
-            
-            # Try nearby text nodes
-            try:
-                parent = element.find_element(By.XPATH, "./..")
-                all_text = parent.text.strip()
-                if all_text and len(all_text) < 200:
-                    # Extract meaningful text that's not just whitespace
-                    lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-                    for line in lines:
-                        if 5 < len(line) < 100 and not line.isdigit():
-                            return line
-            except:
-                pass
-                
-            # Try placeholder or name attribute as fallback
-            placeholder = element.get_attribute('placeholder')
-            if placeholder and placeholder.strip():
-                return placeholder.strip()
-                
-            name = element.get_attribute('name')
+            result = self.driver.execute_script("""
+                var e = arguments[0];
+                function text(el) { return el ? (el.innerText || '').trim() : ''; }
+                function isNumber(t) { return /^\\d+$/.test(t); }
+                
+                // Try to find associated label by ID
+                if (e.id) {
+                    var forLabel = text(document.querySelector("label[for='" + CSS.escape(e.id) + "']"));
+                    if (forLabel) return {label: forLabel};
+                }
+                
+                // Try aria-label or aria-labelledby
+                var aria = e.getAttribute('aria-label');
+                if (aria) return {label: aria.trim()};
+                var labelledBy = e.getAttribute('aria-labelledby');
+                if (labelledBy) {
+                    var labelledNode = document.getElementById(labelledBy);
+                    if (labelledNode) return {label: text(labelledNode)};
+                }
+                
+                // Try parent and ancestor elements for labels
+                var parent = e.parentElement;
+                var ancestors = parent ? [
+                    parent.closest("[class*='form-element']"),
+                    parent.closest("[class*='jobs-easy-apply-form-element']"),
+                    parent,
+                    parent.parentElement
+                ] : [];
+                var labelSelectors = [
+                    "label",
+                    ".label",
+                    ".form-label",
+                    "[class*='label']",
+                    ".jobs-easy-apply-form-element__label",
+                    ".artdeco-text-input__label"
+                ];
+                for (var i = 0; i < ancestors.length; i++) {
+                    if (!ancestors[i]) continue;
+                    for (var j = 0; j < labelSelectors.length; j++) {
+                        var ancestorLabel = text(ancestors[i].querySelector(labelSelectors[j]));
+                        if (ancestorLabel && ancestorLabel.length < 200) return {label: ancestorLabel};
+                    }
+                }
+                
+                // Try sibling elements - up to 3 on each side, in document order
+                var siblings = [];
+                for (var prev = e.previousElementSibling; prev && siblings.length < 3; prev = prev.previousElementSibling) {
+                    siblings.unshift(prev);
+                }
+                for (var next = e.nextElementSibling, count = 0; next && count < 3; next = next.nextElementSibling, count++) {
+                    siblings.push(next);
+                }
+                for (var k = 0; k < siblings.length; k++) {
+                    var siblingText = text(siblings[k]);
+                    if (siblingText.length > 5 && siblingText.length < 200 && !isNumber(siblingText)) return {label: siblingText};
+                }
+                
+                // Try nearby text nodes
+                var parentText = text(parent);
+                if (parentText && parentText.length < 200) {
+                    var lines = parentText.split('\\n');
+                    for (var m = 0; m < lines.length; m++) {
+                        var line = lines[m].trim();
+                        if (line.length > 5 && line.length < 100 && !isNumber(line)) return {label: line};
+                    }
+                }
+                
+                // Try placeholder as fallback, the name attribute is formatted in Python
+                var placeholder = (e.getAttribute('placeholder') || '').trim();
+                if (placeholder) return {label: placeholder};
+                return {label: '', name: e.getAttribute('name') || ''};
+            """, element) or {}
+            
+            if result.get('label'):
+                return result['label']
+            
+            name = result.get('name')
             if name:
                 formatted_name = name.replace('_', ' ').replace('-', ' ').title()
                 return formatted_name
@@ -2760,28 +3116,33 @@ class StealthLinkedin:
             urlWords = utils.urlToKeywords(url)
             
             for page in range(totalPages):
-                # Add random breaks
+                currentPageJobs = constants.jobsPerPage * page
+                url_with_start = url + "&start=" + str(currentPageJobs)
+                # Don't reload a results page we are already on
+                navigated = self.driver.current_url != url_with_start
+                if navigated:
+                    self.driver.get(url_with_start)
+                
+                # Add random breaks - taken after navigating, so the page loads during the break
                 if random.randint(1, 10) == 1:  # 10% chance
                     print("Taking a random break...")
                     self.human_like_delay(30, 60)  # 30-60 second break
-                
-                currentPageJobs = constants.jobsPerPage * page
-                url_with_start = url + "&start=" + str(currentPageJobs)
-                self.driver.get(url_with_start)
-                self.human_like_delay(3, 6)
+                elif navigated:
+                    self.human_like_delay(3, 6)
 
-                offersPerPage = self.driver.find_elements(By.XPATH,'//li[@data-occludable-job-id]')
-                
-                offerIds = []
-                for offer in offersPerPage:
-                    offerId = offer.get_attribute("data-occludable-job-id")
-                    if offerId:
-                        offerIds.append(int(offerId.split(":")[-1]))
+                # Read every job id on the page in a single call
+                rawOfferIds = self.driver.execute_script(
+                    "return Array.from(document.querySelectorAll('li[data-occludable-job-id]'))"
+                    ".map(function(li) { return li.getAttribute('data-occludable-job-id'); });") or []
+                offerIds = [int(offerId.split(":")[-1]) for offerId in rawOfferIds if offerId]
 
-                for jobID in offerIds:
+                for index, jobID in enumerate(offerIds):
                     offerPage = 'https://www.linkedin.com/jobs/view/' + str(jobID)
-                    self.driver.get(offerPage)
-                    self.human_like_delay(3, 6)
+                    # Skip the reload only when this exact job view is open, e.g. loaded during a break;
+                    # the results list carries currentJobId=<id> and must not count as being there
+                    if job_id_from_url(self.driver.current_url) != str(jobID):
+                        self.driver.get(offerPage)
+                        self.human_like_delay(3, 6)
                     
                     # Random mouse movement
                     self.random_mouse_movement()
@@ -2794,19 +3155,19 @@ class StealthLinkedin:
                     
                     # Scroll down to see the apply button (human behavior)
                     self.driver.execute_script("window.scrollTo(0, 500);")
-                    self.human_like_delay(1, 2)
                     
                     button = self.easyApplyButton()
                     
                     if button:
                         try:
                             button.click()
-                            self.human_like_delay(2, 4)
+                            # Returns once the modal's Continue/Review/Submit button is there
+                            self.wait_for_step_change()
                             countApplied += 1
                             
                             # Try immediate submit
                             try:
-                                submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Submit application']")
+                                submit_btn = self.driver.find_element(*_SUBMIT_BUTTONS[0])
                                 submit_btn.click()
                                 self.human_like_delay(2, 4)
                                 print(f"✅ Applied: {offerPage}")
@@ -2825,27 +3186,27 @@ class StealthLinkedin:
                     # Occasional longer breaks
                     if countJobs % 20 == 0:
                         print("Taking a longer break...")
+                        # Load the next job now so the break absorbs its page load
+                        if index + 1 < len(offerIds):
+                            self.driver.get('https://www.linkedin.com/jobs/view/' + str(offerIds[index + 1]))
                         self.human_like_delay(120, 300)  # 2-5 minute break
 
     def extract_job_context(self):
         """Extract job context for AI processing"""
         context = {}
         try:
-            # Get job title
-            title_elem = self.driver.find_element(By.CSS_SELECTOR, "h1")
-            context['title'] = title_elem.text
-            
-            # Get company name
-            company_elem = self.driver.find_element(By.CSS_SELECTOR, ".jobs-unified-top-card__company-name")
-            context['company'] = company_elem.text
-            
-            # Get job description (first 1000 chars)
-            try:
-                desc_elem = self.driver.find_element(By.CSS_SELECTOR, ".jobs-description__content")
-                context['description'] = desc_elem.text[:1000]
-            except:
-                context['description'] = ""
-                
+            # Title, company name and the first 1000 chars of the description in one call
+            context = self.driver.execute_script("""
+                function text(selector) {
+                    var el = document.querySelector(selector);
+                    return el ? (el.innerText || '').trim() : '';
+                }
+                return {
+                    title: text('h1'),
+                    company: text('.jobs-unified-top-card__company-name'),
+                    description: text('.jobs-description__content').slice(0, 1000)
+                };
+            """) or {}
         except:
             pass
             
@@ -2856,9 +3217,11 @@ class StealthLinkedin:
         try:
             steps_completed = 0
             max_steps = 10  # Prevent infinite loops
+            self._label_cache.clear()  # Labels from the previous application are stale
             
             while steps_completed < max_steps:
                 print(f"📋 Processing step {steps_completed + 1}...")
+                self._locate_easy_apply_root()
                 
                 # CHANGED: Always analyze the form first before trying to skip
                 print("🔍 Analyzing current step for form content...")
@@ -2867,7 +3230,7 @@ class StealthLinkedin:
                 if form_handled:
                     print("✅ Form handled successfully")
                     steps_completed += 1
-                    self.human_like_delay(2, 4)
+                    self.wait_for_step_change()
                     continue
                 else:
                     print("⚠️ No form content to handle, trying direct navigation...")
@@ -2891,74 +3254,42 @@ class StealthLinkedin:
                     print("✅ Found alternative navigation")
                     
                 steps_completed += 1
-                self.human_like_delay(2, 4)
+                self.wait_for_step_change()
             
             # Handle final submission
             return self.handle_final_submission(offerPage)
                 
         except Exception as e:
             return f"❌ Error in multi-step application: {offerPage} - {str(e)[:50]}"
+        finally:
+            self._easy_apply_root = None
 
     def is_final_step(self):
         """Check if we're at the final submission step"""
-        final_indicators = [
-            "button[aria-label='Submit application']",
-            "button[aria-label='Review your application']", 
-            "//button[contains(text(), 'Submit application')]",
-            "//button[contains(text(), 'Submit Application')]",
-            "//button[contains(text(), 'Review')]",
-            "//button[contains(text(), 'Submit')]",
-            ".jobs-easy-apply-footer button[data-easy-apply-submit-button]",
-            "button[data-test-modal-close-btn]", # Sometimes the X button indicates completion
-            "//span[contains(text(), 'Application sent')]", # Success message
-        ]
-        
-        for selector in final_indicators:
-            try:
-                if selector.startswith("//"):
-                    element = self.driver.find_element(By.XPATH, selector)
-                else:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                if element.is_displayed():
-                    print(f"📋 Found final step indicator: {element.text if hasattr(element, 'text') else selector}")
-                    return True
-            except:
-                continue
+        # Probe every CSS and XPath indicator in a single call
+        match = self._first_visible(_FINAL_STEP_INDICATORS)
+        if match:
+            selector, element = match
+            print(f"📋 Found final step indicator: {selector}")
+            return True
         
         return False
 
     def try_alternative_navigation(self):
         """Try alternative navigation buttons including Review step"""
-        alt_buttons = [
-            "//button[contains(text(), 'Review')]",
-            "//button[contains(text(), 'Review your application')]",
-            "//button[contains(text(), 'Submit application')]", 
-            "//button[contains(text(), 'Submit Application')]",
-            "//button[contains(text(), 'Submit')]",
-            "//button[contains(text(), 'Apply')]",
-            "//button[contains(text(), 'Send application')]",
-            "//button[contains(text(), 'Skip')]",
-            ".jobs-easy-apply-footer button:not([disabled])",
-            "button[aria-label='Review your application']",
-            "button[aria-label='Submit application']"
-        ]
-        
-        for selector in alt_buttons:
-            try:
-                if selector.startswith("//"):
-                    button = self.driver.find_element(By.XPATH, selector)
-                else:
-                    button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                if button.is_enabled() and button.is_displayed():
-                    button_text = button.text.strip()
-                    print(f"🔄 Trying alternative button: {button_text}")
-                    button.click()
-                    self.human_like_delay(2, 3)
-                    return True
-            except Exception as e:
-                continue
+        # Probe every button selector in a single call, skipping disabled ones like before
+        try:
+            match = self._first_visible(_ALT_NAVIGATION_BUTTONS, require_enabled=True)
+            if match:
+                selector, button = match
+                button_text = button.text.strip()
+                print(f"🔄 Trying alternative button: {button_text}")
+                button.click()
+                self.wait_for_step_change(button)
+                self._label_cache.clear()
+                return True
+        except Exception as e:
+            pass
         
         return False
 
@@ -2968,125 +3299,87 @@ class StealthLinkedin:
             print("📝 Starting final submission process...")
             
             # First, try to find and click Review button if present
-            review_selectors = [
-                "//button[contains(text(), 'Review')]",
-                "//button[contains(text(), 'Review your application')]",
-                "button[aria-label='Review your application']"
-            ]
-            
             review_clicked = False
-            for selector in review_selectors:
+            match = self._first_visible(_REVIEW_BUTTONS, require_enabled=True)
+            if match:
                 try:
-                    if selector.startswith("//"):
-                        review_btn = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        review_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        
-                    if review_btn.is_enabled() and review_btn.is_displayed():
-                        print("📋 Clicking Review button...")
-                        review_btn.click()
-                        self.human_like_delay(3, 5)
-                        review_clicked = True
-                        break
-                except:
-                    continue
+                    review_btn = match[1]
+                    print("📋 Clicking Review button...")
+                    review_btn.click()
+                    self.wait_for_step_change(review_btn)
+                    review_clicked = True
+                except _CLICK_ERRORS:
+                    pass
             
             # Unfollow company if configured
-            if not getattr(config, 'followCompanies', False):
+            if not self.cfg.follow_companies:
                 try:
-                    follow_selectors = [
-                        "input[id*='follow']",
-                        "label[for*='follow'] input",
-                        "input[type='checkbox'][id*='follow']",
-                        "//label[contains(text(), 'follow')]/input",
-                        "//input[@type='checkbox' and contains(@aria-label, 'follow')]"
-                    ]
-                    
-                    for selector in follow_selectors:
-                        try:
-                            if selector.startswith("//"):
-                                follow_elem = self.driver.find_element(By.XPATH, selector)
-                            else:
-                                follow_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                
-                            if follow_elem.is_selected() and follow_elem.is_displayed():
-                                follow_elem.click()
-                                self.human_like_delay(1, 2)
-                                print("✅ Unfollowed company")
-                                break
-                        except:
-                            continue
-                except:
+                    # Find the first checked, visible follow box and untick it in the page
+                    unfollowed = self.driver.execute_script("""
+                        var locators = arguments[0];
+                        for (var i = 0; i < locators.length; i++) {
+                            var el;
+                            if (locators[i][0] === 'xpath') {
+                                el = document.evaluate(locators[i][1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                            } else {
+                                el = document.querySelector(locators[i][1]);
+                            }
+                            if (el && el.checked && (el.offsetParent !== null || el.getClientRects().length)) {
+                                el.click();  // Native click fires the input/change events the form listens to
+                                return true;
+                            }
+                        }
+                        return false;
+                    """, _FOLLOW_CHECKBOXES)
+                    if unfollowed:
+                        self.human_like_delay(1, 2)
+                        print("✅ Unfollowed company")
+                except WebDriverException:
                     pass
             
             # Now try to submit application with comprehensive selectors
-            submit_selectors = [
-                "button[aria-label='Submit application']",
-                "button[data-easy-apply-submit-button]",
-                "//button[contains(text(), 'Submit application')]",
-                "//button[contains(text(), 'Submit Application')]",
-                "//button[contains(text(), 'Send application')]",
-                "//button[contains(text(), 'Apply now')]",
-                "//button[contains(text(), 'Submit')]",
-                "//button[contains(text(), 'Apply')]",
-                ".jobs-easy-apply-footer button[type='submit']",
-                "button[type='submit']:not([disabled])",
-                "//button[@type='submit' and not(@disabled)]"
-            ]
-            
             submission_attempted = False
-            for selector in submit_selectors:
+            match = self._first_visible(_SUBMIT_BUTTONS, require_enabled=True)
+            if match:
                 try:
-                    if selector.startswith("//"):
-                        submit_btn = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        submit_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        
-                    if submit_btn.is_enabled() and submit_btn.is_displayed():
-                        button_text = submit_btn.text.strip()
-                        print(f"🚀 Clicking submit button: {button_text}")
-                        submit_btn.click()
-                        self.human_like_delay(3, 5)
-                        submission_attempted = True
-                        break
-                except Exception as e:
-                    continue
+                    submit_btn = match[1]
+                    button_text = submit_btn.text.strip()
+                    print(f"🚀 Clicking submit button: {button_text}")
+                    submit_btn.click()
+                    submission_attempted = True
+                except _CLICK_ERRORS:
+                    pass
             
             if not submission_attempted:
                 print("⚠️ No submit button found, trying JavaScript click on all buttons...")
                 # Last resort: try clicking any enabled button in the footer
                 try:
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-footer button, button[type='submit']")
-                    for btn in buttons:
-                        if btn.is_enabled() and btn.is_displayed():
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            print(f"🔄 JavaScript clicked: {btn.text}")
-                            self.human_like_delay(3, 5)
-                            submission_attempted = True
-                            break
-                except:
+                    # Filter and click in the page, returning the clicked button's text (or null)
+                    clicked_text = self.driver.execute_script("""
+                        var buttons = document.querySelectorAll(".jobs-easy-apply-footer button, button[type='submit']");
+                        for (var i = 0; i < buttons.length; i++) {
+                            var btn = buttons[i];
+                            if (!btn.disabled && (btn.offsetParent !== null || btn.getClientRects().length)) {
+                                btn.click();
+                                return (btn.innerText || '').trim();
+                            }
+                        }
+                        return null;
+                    """)
+                    if clicked_text is not None:
+                        print(f"🔄 JavaScript clicked: {clicked_text}")
+                        submission_attempted = True
+                except WebDriverException:
                     pass
             
             if submission_attempted:
-                # Check for success indicators
-                self.human_like_delay(2, 4)
-                success_indicators = [
-                    "//h3[contains(text(), 'Application sent')]",
-                    "//h3[contains(text(), 'Your application was sent')]", 
-                    "//div[contains(text(), 'Application submitted')]",
-                    "//span[contains(text(), 'Application sent')]",
-                    ".jobs-easy-apply-content--success",
-                    "//div[contains(text(), 'successfully')]",
-                    "//div[contains(@class, 'success')]"
-                ]
-                
-                for success_selector in success_indicators:
-                    try:
-                        success_elem = self.driver.find_element(By.XPATH, success_selector)
-                        if success_elem.is_displayed():
-                            return f"✅ Application submitted successfully: {offerPage}"
-                    except:
-                        continue
+                # Check for success indicators, returning as soon as one shows up
+                try:
+                    self._page_wait.until(lambda driver: self._submission_confirmed())
+                    self.human_like_delay(0.5, 1.5)
+                    return f"✅ Application submitted successfully: {offerPage}"
+                except TimeoutException:
+                    pass
                 
                 # If no success message found, assume it worked if we got this far
                 return f"✅ Application submitted: {offerPage}"
@@ -3096,77 +3389,52 @@ class StealthLinkedin:
         except Exception as e:
             return f"❌ Error in final submission: {offerPage} - {str(e)[:100]}"
 
+    def _submission_confirmed(self):
+        """Check the application modal's text for a confirmation message in one call"""
+        try:
+            text = self.driver.execute_script("""
+                var node = document.querySelector('.jobs-easy-apply-content--success, .artdeco-modal__content, .jobs-easy-apply-content') || document.body;
+                return (node.innerText || '').slice(0, 2000);
+            """)
+        except WebDriverException:
+            return False
+        return bool(text and _SUCCESS_RE.search(text))
+
     def generate_job_search_urls_from_cv(self):
         """Generate job search URLs based on CV skills and experience"""
+        cv_data = self.ai_agent.cv_data
         try:
-            skills = self.ai_agent.cv_data.get('skills', [])
-            experience = self.ai_agent.cv_data.get('experience_years', '0')
-            current_title = self.ai_agent.cv_data.get('current_title', 'Software Developer')
-            location = self.ai_agent.cv_data.get('location', 'India')
+            skills = cv_data.get('skills', [])
+            current_title = cv_data.get('current_title', 'Software Developer')
             
-            # Use AI to suggest relevant job titles and keywords
-            search_prompt = f"""
-Based on this professional profile, suggest 10 relevant job search keywords and titles for LinkedIn job search:
-
-Skills: {', '.join(skills[:15])}  # Limit to top 15 skills
-Experience: {experience} years
-Current Title: {current_title}
-Location: {location}
-
-Return only a JSON array of job search terms, like:
-["Software Developer", "Python Developer", "Full Stack Developer", "Backend Developer", "Data Scientist"]
-
-Focus on the most relevant job titles based on the skills and experience.
-"""
-            
-            response = requests.post(f"{self.ai_agent.ollama_url}/api/generate", 
-                                   json={
-                                       "model": self.ai_agent.model,
-                                       "prompt": search_prompt,
-                                       "stream": False,
-                                       "options": {"temperature": 0.2}
-                                   }, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()['response'].strip()
-                
-                # Clean up and parse JSON
-                if '```json' in result:
-                    result = result.split('```json')[1].split('```')[0]
-                elif '```' in result:
-                    result = result.split('```')[1].split('```')[0]
-                
-                try:
-                    job_keywords = json.loads(result)
-                    print(f"🎯 AI suggested job keywords: {job_keywords}")
-                    return job_keywords
-                except:
-                    pass
+            # Use AI to suggest relevant job titles and keywords (cached on the agent with the CV analysis)
+            job_keywords = self.ai_agent.analyze_cv_multi()
+            if job_keywords:
+                print(f"🎯 AI suggested job keywords: {job_keywords}")
+                return job_keywords
             
             # Fallback to skills-based keywords
-            fallback_keywords = skills[:8] + [current_title]  # Top 8 skills + current title
+            fallback_keywords = [*skills[:8], current_title]  # Top 8 skills + current title
             print(f"🎯 Using skills-based keywords: {fallback_keywords}")
             return fallback_keywords
             
         except Exception as e:
             print(f"❌ Error generating job keywords: {e}")
-            return [self.ai_agent.cv_data.get('current_title', 'Software Developer')]
+            return [cv_data.get('current_title', 'Software Developer')]
 
     def generateUrls(self):
         """Generate job URLs using config settings and existing utils"""
-        if not os.path.exists('data'):
-            os.makedirs('data')
         try: 
-            with open('data/urlData.txt', 'w', encoding="utf-8") as file:
+            with open('data/urlData.txt', 'w', encoding="utf-8", newline="\n") as file:
                 # Use existing URL generator with config values
                 try:
                     linkedinJobLinks = utils.LinkedinUrlGenerate().generateUrlLinks()
                     print(f"✅ Generated {len(linkedinJobLinks)} URLs using config settings")
-                    print(f"📋 Using locations: {getattr(config, 'location', ['Europe'])}")
-                    print(f"📋 Using keywords: {getattr(config, 'keywords', ['Software Engineer'])[:5]}...")
-                    print(f"📋 Using experience levels: {getattr(config, 'experienceLevels', ['Mid-Senior level'])}")
-                    print(f"📋 Using job types: {getattr(config, 'jobType', ['Full-time'])}")
-                    print(f"📋 Using remote options: {getattr(config, 'remote', ['On-site'])}")
+                    print(f"📋 Using locations: {list(self.cfg.locations)}")
+                    print(f"📋 Using keywords: {list(self.cfg.keywords[:5])}...")
+                    print(f"📋 Using experience levels: {list(self.cfg.experience_levels)}")
+                    print(f"📋 Using job types: {list(self.cfg.job_types)}")
+                    print(f"📋 Using remote options: {list(self.cfg.remote)}")
                 except Exception as e:
                     print(f"⚠️ Config URL generation failed: {e}")
                     # Fallback: get AI-suggested job keywords and generate manually
@@ -3174,91 +3442,70 @@ Focus on the most relevant job titles based on the skills and experience.
                     linkedinJobLinks = self.generate_linkedin_urls_from_keywords(job_keywords)
                     print(f"✅ Generated {len(linkedinJobLinks)} URLs using CV analysis fallback")
                 
-                for url in linkedinJobLinks:
-                    file.write(url + "\n")
+                # Repeated keywords/locations yield identical searches; crawl each one only once
+                linkedinJobLinks = list(dict.fromkeys(linkedinJobLinks))
+                
+                file.write("".join(url + "\n" for url in linkedinJobLinks))
                     
         except Exception as e:
             print(f"❌ Could not generate URLs: {e}")
     
     def generate_linkedin_urls_from_keywords(self, keywords):
         """Generate LinkedIn job search URLs from keywords"""
-        base_url = "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_TPR=r86400&f_E=2,3,4&f_AL=true"
+        base_url = "https://www.linkedin.com/jobs/search/?"
         
         location = self.ai_agent.cv_data.get('location', 'India')
-        urls = []
         
-        for keyword in keywords[:10]:  # Limit to 10 searches
-            formatted_keyword = keyword.replace(' ', '%20')
-            formatted_location = location.replace(' ', '%20')
-            url = base_url.format(formatted_keyword, formatted_location)
-            urls.append(url)
-        
-        return urls
+        # Proper encoding so keywords like "C++" or "C#" survive; filters stay readable
+        return [
+            base_url + urlencode({
+                'keywords': keyword,
+                'location': location,
+                'f_TPR': 'r86400',
+                'f_E': '2,3,4',
+                'f_AL': 'true'
+            }, safe=',')
+            for keyword in islice(keywords, 10)  # Limit to 10 searches
+        ]
 
     def getJobProperties(self, count):
         """Extract job properties with better error handling"""
-        job_data = {
-            'title': 'N/A',
-            'company': 'N/A', 
-            'location': 'N/A',
-            'workplace': 'N/A',
-            'posted_date': 'N/A',
-            'applications': 'N/A'
-        }
-        
-        selectors = [
-            ('title', "h1"),
-            ('company', ".jobs-unified-top-card__company-name a, .jobs-unified-top-card__company-name"),
-            ('location', ".jobs-unified-top-card__bullet"),
-            ('workplace', ".jobs-unified-top-card__workplace-type"),
-            ('posted_date', "span:contains('ago'), .jobs-unified-top-card__posted-date"),
-            ('applications', ".jobs-unified-top-card__applicant-count")
-        ]
+        try:
+            # Resolve every field in the page with a single round-trip
+            job_data = self.driver.execute_script("""
+                var out = {};
+                arguments[0].forEach(function(locator) {
+                    var key = locator[0], el;
+                    if (out[key]) return;
+                    if (locator[1] === 'xpath') {
+                        el = document.evaluate(locator[2], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                    } else {
+                        el = document.querySelector(locator[2]);
+                    }
+                    if (el) out[key] = (el.innerText || el.innerHTML || '').trim();
+                });
+                return out;
+            """, _JOB_PROPERTY_LOCATORS) or {}
+        except WebDriverException:
+            job_data = {}
         
-        for key, selector in selectors:
-            try:
-                if ':contains' in selector:
-                    # Use XPath for text-based selection
-                    text = selector.split(':contains(')[1][1:-2]
-                    xpath = f"//*[contains(text(), '{text}')]"
-                    element = self.driver.find_element(By.XPATH, xpath)
-                else:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                job_data[key] = element.text.strip() if element.text else element.get_attribute("innerHTML").strip()
-                
-                # Clean up the text
-                if len(job_data[key]) > 100:
-                    job_data[key] = job_data[key][:100] + "..."
-                    
-            except Exception as e:
-                job_data[key] = 'N/A'
+        values = []
+        for key in ('title', 'company', 'location', 'workplace', 'posted_date', 'applications'):
+            value = job_data.get(key) or 'N/A'
+            # Clean up the text
+            if len(value) > 100:
+                value = value[:100] + "..."
+            values.append(value)
         
-        return f"{count} | {job_data['title']} | {job_data['company']} | {job_data['location']} | {job_data['workplace']} | {job_data['posted_date']} | {job_data['applications']}"
+        return f"{count} | " + " | ".join(values)
 
     def easyApplyButton(self):
-        """Find Easy Apply button with multiple selectors"""
-        selectors = [
-            "button[aria-label*='Easy Apply']",
-            "button:contains('Easy Apply')",
-            ".jobs-apply-button",
-            "button[data-job-id]"
-        ]
-        
-        for selector in selectors:
-            try:
-                if ':contains' in selector:
-                    xpath = "//button[contains(text(), 'Easy Apply')]"
-                    button = self.driver.find_element(By.XPATH, xpath)
-                else:
-                    button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                if button.is_enabled():
-                    return button
-            except:
-                continue
-                
-        return None
+        """Find Easy Apply button with multiple selectors, waiting briefly for it to render"""
+        try:
+            match = self._button_wait.until(lambda driver: self._first_visible(_EASY_APPLY_BUTTONS, require_enabled=True))
+        except TimeoutException:
+            return None
+        return match[1]
 
 # Usage
 if __name__ == "__main__":
@@ -4,12 +4,17 @@ Automates the setup process and dependency installation
 """
 
 import os
+import re
 import sys
 import subprocess
 import platform
 import json
 from pathlib import Path
 
+# CV file detection: allowed extensions and name keywords
+_CV_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc', '.txt'})
+_CV_KEYWORD_RE = re.compile(r'cv|resume|curriculum', re.I)
+
 def print_header():
     """Print setup header"""
     print("🚀 Enhanced LinkedIn Job Application Bot Setup")
@@ -41,6 +46,17 @@ def install_python_packages():
         "openpyxl"  # For Excel export
     ]
     
+    # One pip run resolves and downloads everything together
+    try:
+        print(f"   Installing {', '.join(packages)}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages], 
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        print("   ✅ All packages installed")
+        return True
+    except subprocess.CalledProcessError:
+        print("   ⚠️  Batch install failed, retrying one package at a time...")
+    
+    # Per-package fallback pinpoints which package is the problem
     for package in packages:
         try:
             print(f"   Installing {package}...")
@@ -168,18 +184,13 @@ def find_cv_files():
     """Find CV files in current directory"""
     print("\n📄 Looking for CV files...")
     
-    cv_extensions = ['.pdf', '.docx', '.doc', '.txt']
-    cv_keywords = ['cv', 'resume', 'curriculum']
-    
-    found_files = []
-    
-    for file in os.listdir('.'):
-        file_lower = file.lower()
-        file_ext = os.path.splitext(file)[1].lower()
-        
-        if file_ext in cv_extensions:
-            if any(keyword in file_lower for keyword in cv_keywords):
-                found_files.append(file)
+    with os.scandir('.') as entries:
+        found_files = [
+            entry.name for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in _CV_EXTENSIONS
+            and _CV_KEYWORD_RE.search(entry.name)
+            and entry.is_file()
+        ]
     
     if found_files:
         print("   ✅ Found CV files:")
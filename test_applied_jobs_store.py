@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Tests for job id parsing and the applied jobs store
+"""
+
+from datetime import datetime
+
+from enhanced_utils import AppliedJobsStore, job_id_from_url
+
+SCRAPED_URL = "https://www.linkedin.com/jobs/view/4012345678/?eBP=CwEAAAGS&refId=abc%3D%3D&trackingId=xyz%3D%3D"
+OTHER_URL = "https://www.linkedin.com/jobs/view/4098765432/?eBP=CwEAAAGS&trackingId=def%3D%3D"
+
+def test_job_id_from_scraped_url():
+    """Job links end in '/?<query>', the id is the numeric /jobs/view/ segment"""
+    assert job_id_from_url(SCRAPED_URL) == "4012345678"
+    assert job_id_from_url("https://www.linkedin.com/jobs/search/?keywords=python") is None
+
+def test_store_is_keyed_on_job_id(tmp_path):
+    """Applying to one job must not mark other jobs, or unparsable URLs, as applied"""
+    store = AppliedJobsStore(str(tmp_path / "applied.db"))
+    store.record(job_id_from_url(SCRAPED_URL), "Acme", "Engineer", "applied", datetime.now(), SCRAPED_URL)
+    store.record("", "Acme", "Engineer", "applied", datetime.now(), "https://www.linkedin.com/jobs/")
+    store.close()
+    
+    store = AppliedJobsStore(str(tmp_path / "applied.db"))
+    assert store.has_applied(job_id_from_url(SCRAPED_URL))
+    assert not store.has_applied(job_id_from_url(OTHER_URL))
+    assert not store.has_applied("")
+    assert store.conn.execute("SELECT COUNT(*) FROM applied").fetchone()[0] == 1
+    store.close()
@@ -74,6 +74,7 @@ config.application_prefs.requires_visa_sponsorship = True  # Set to False if you
 config.application_prefs.follow_companies = False
 config.application_prefs.max_applications_per_day = 50
 config.application_prefs.delay_between_applications = (30, 60)  # seconds
+config.application_prefs.prefetch_next = True  # Load the next job page during the delay
 config.application_prefs.auto_skip_complex_forms = False
 
 # Default responses to common questions
@@ -99,37 +100,43 @@ config.application_prefs.default_responses.update({
 # ============================================================================
 
 # Companies to avoid
-config.filtering.blacklisted_companies = [
+config.filtering.blacklisted_companies = keyword_set(
     "Apple", "Google", "Microsoft", "Amazon", "Facebook", "Meta", "Netflix",
     "IBM", "Salesforce", "Oracle", "SAP", "Intel", "Cisco", "Adobe",
     "Accenture", "Capgemini", "TCS", "Cognizant", "Infosys", "Wipro", "HCL"
-]
+)
 
 # Only apply to these companies (leave empty for all companies)
-config.filtering.whitelisted_companies = [
+config.filtering.whitelisted_companies = keyword_set(
     # "Startup Company", "Preferred Company"
-]
+)
 
-# Job titles to avoid
-config.filtering.blacklisted_titles = [
-    "manager", "sales", "marketing", "hr", "recruiter", "intern", "junior",
+# Job titles to avoid (whole words, so "hr" does not match "Chrome")
+config.filtering.blacklisted_titles = keyword_set(
+    "manager", "sales", "marketing", "hr", "recruiter", "intern", "internship", "junior",
     ".net", "c#", "java developer", "php developer"
-]
+)
 
 # Only apply to jobs with these titles (leave empty for all titles)
-config.filtering.whitelisted_titles = [
+config.filtering.whitelisted_titles = keyword_set(
     # "senior", "lead", "architect", "principal"
-]
+)
+
+# Set to True to skip jobs by the skill lists below
+config.filtering.filter_by_skills = False
 
 # Skills that must be present in job description
-config.filtering.required_skills = [
+config.filtering.required_skills = keyword_set(
     # "python", "javascript", "react"
-]
+)
 
 # Skills to avoid in job description
-config.filtering.avoided_skills = [
+config.filtering.avoided_skills = keyword_set(
     ".NET", "C#", "Java", "PHP", "Ruby", "COBOL", "Fortran"
-]
+)
+
+# Rebuild the filter matchers from the keyword sets above
+config.filtering.refresh_matchers()
 
 # Salary range preferences (USD)
 config.filtering.min_salary = 60000
@@ -143,11 +150,14 @@ config.browser.browser = "chrome"  # or "firefox"
 config.browser.headless = False  # Set to True to run without GUI
 config.browser.enable_stealth = True
 config.browser.window_size = (1920, 1080)
+config.browser.user_data_dir = "~/.linkedin_bot/chrome_profile"  # Keeps you logged in between runs ("" for a fresh profile)
+config.browser.disk_cache_size = 200_000_000  # bytes
 
 # Timing configurations
 config.browser.page_load_timeout = 30
 config.browser.element_timeout = 10
 config.browser.typing_delay = 0.1
+config.browser.paste_threshold = 40  # Texts longer than this are entered at once
 config.browser.human_delay = (1, 3)
 
 # ============================================================================
@@ -158,15 +168,19 @@ config.ai.ollama_url = "http://localhost:11434"
 config.ai.model = "qwen2.5:7b"  # or "llama3", "mistral", etc.
 config.ai.cv_path = "/Users/amankumar/Desktop/Aman Kumar Huriya CV .pdf"
 config.ai.temperature = 0.1
+config.ai.concurrent_evals = 4  # Form questions answered in parallel (1 = one at a time)
+config.ai.cache_path = "~/.linkedin_bot/ai_cache.sqlite"  # "" to disable caching AI answers
+config.ai.cache_ttl = 7 * 86400  # seconds
 config.ai.enable_cover_letter_generation = True
 
 # ============================================================================
 # SECURITY CONFIGURATION
 # ============================================================================
 
-# LinkedIn credentials (better to use environment variables)
-config.security.linkedin_email = "amanhuriya2@gmail.com"
-config.security.linkedin_password = "Testings@321"
+# LinkedIn credentials are read from the LINKEDIN_EMAIL and LINKEDIN_PASSWORD
+# environment variables. To hardcode them instead (less secure), uncomment:
+# config.security.linkedin_email = "your.email@example.com"
+# config.security.linkedin_password = "your-password"
 
 # Security settings
 config.security.enable_2fa_detection = True
@@ -180,4 +194,5 @@ config.security.cooldown_on_detection = 300  # seconds
 config.logging.log_level = "INFO"  # DEBUG, INFO, WARNING, ERROR
 config.logging.save_screenshots = True
 config.logging.export_applied_jobs = True
-config.logging.export_format = "csv"  # csv, json, xlsx
\ No newline at end of file
+config.logging.export_sqlite = "~/.linkedin_bot/applied.db"  # Jobs already applied to are skipped next run ("" disables)
+config.logging.export_format = "csv"  # csv or arrow (needs pyarrow, falls back to csv)
\ No newline at end of file